@@ -0,0 +1,21 @@
+"""Shared base class for Project Pravaah agents.
+
+The agents each need the same three things at construction time: the
+project ID, the process-wide Firestore client, and a logger. Doing that
+setup once here means instantiating all agents together builds a single
+Firestore channel instead of one per agent.
+"""
+
+import logging
+
+from ._clients import get_firestore_client
+
+
+class _BaseAgent:
+    """Common initialization for Pravaah agents (Firestore client + logger)."""
+
+    def __init__(self, project_id: str = "stable-sign-454210-i0"):
+        self.project_id = project_id
+        self.db = get_firestore_client(project_id)
+        self.logger = logging.getLogger(self.__class__.__name__)
+        self.logger.setLevel(logging.INFO)
@@ -0,0 +1,31 @@
+"""Shared Google Cloud client factories for Project Pravaah agents.
+
+Constructing `firestore.Client` or a Pub/Sub client opens a gRPC channel
+and loads credentials immediately, so building one per agent wastes both
+startup time and memory. These memoized factories let every agent in the
+process share a single client (and therefore a single channel) per
+project, which matters most on Cloud Run where cold start dominates.
+"""
+
+import functools
+
+from google.cloud import firestore
+from google.cloud import pubsub_v1
+
+
+@functools.lru_cache(maxsize=None)
+def get_firestore_client(project_id: str) -> firestore.Client:
+    """Return the process-wide Firestore client for a project."""
+    return firestore.Client(project=project_id)
+
+
+@functools.lru_cache(maxsize=None)
+def get_publisher_client() -> pubsub_v1.PublisherClient:
+    """Return the process-wide Pub/Sub publisher client."""
+    return pubsub_v1.PublisherClient()
+
+
+@functools.lru_cache(maxsize=None)
+def get_subscriber_client() -> pubsub_v1.SubscriberClient:
+    """Return the process-wide Pub/Sub subscriber client."""
+    return pubsub_v1.SubscriberClient()
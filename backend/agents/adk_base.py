@@ -5,19 +5,24 @@ Urban Mobility Operating System - Agent Development Kit Integration
 """
 
 import os
-import json
+import time
 import uuid
 import asyncio
 import logging
+import functools
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional, Union
-from dataclasses import dataclass, asdict
-from enum import Enum
+from dataclasses import dataclass
+from enum import Enum, IntEnum
 
+import orjson
 import yaml
+from cachetools import TTLCache
 from google.cloud import firestore
 from google.cloud import pubsub_v1
+from google.cloud.pubsub_v1.subscriber.scheduler import ThreadScheduler
 import firebase_admin
 from firebase_admin import credentials
 
@@ -25,17 +30,76 @@ from firebase_admin import credentials
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-class AgentCapability(Enum):
-    """Standard agent capabilities for Project Pravaah."""
-    PERCEPTION = "perception"
-    PREDICTION = "prediction"
-    DECISION_MAKING = "decision_making"
-    COMMUNICATION = "communication"
-    TRAFFIC_MONITORING = "traffic_monitoring"
-    TELEMETRY_INGESTION = "telemetry_ingestion"
-    CONGESTION_PREDICTION = "congestion_prediction"
-    STRATEGIC_PLANNING = "strategic_planning"
-    NOTIFICATION_DELIVERY = "notification_delivery"
+# Timestamps land on every A2A response and metrics update, so the ISO
+# string is memoized at 1s granularity instead of re-formatted per call
+_TS_CACHE = (0, "")
+
+
+def _now_iso() -> str:
+    """Current UTC time in ISO format, memoized at 1s granularity."""
+    global _TS_CACHE
+    sec = int(time.time())
+    if _TS_CACHE[0] != sec:
+        _TS_CACHE = (sec, datetime.now(timezone.utc).isoformat())
+    return _TS_CACHE[1]
+
+# Memoized client factories - gRPC clients are expensive to construct
+# (channel + auth on init), so all ADK components in the process share them
+@functools.lru_cache(maxsize=None)
+def _get_firestore_client(project_id: str) -> firestore.Client:
+    """Return the process-wide Firestore client for a project."""
+    return firestore.Client(project=project_id)
+
+@functools.lru_cache(maxsize=None)
+def _get_async_firestore_client(project_id: str) -> firestore.AsyncClient:
+    """Return the process-wide async Firestore client for a project."""
+    return firestore.AsyncClient(project=project_id)
+
+@functools.lru_cache(maxsize=None)
+def _get_publisher_client() -> pubsub_v1.PublisherClient:
+    """Return the process-wide Pub/Sub publisher client.
+
+    Batch settings let concurrent publishes coalesce into one RPC
+    (up to 100 messages / 1MB / 10ms latency window) instead of paying
+    a network round-trip per message.
+    """
+    return pubsub_v1.PublisherClient(
+        publisher_options=pubsub_v1.types.PublisherOptions(
+            enable_message_ordering=False
+        ),
+        batch_settings=pubsub_v1.types.BatchSettings(
+            max_messages=100,
+            max_bytes=1024 * 1024,
+            max_latency=0.01
+        )
+    )
+
+@functools.lru_cache(maxsize=None)
+def _get_subscriber_client() -> pubsub_v1.SubscriberClient:
+    """Return the process-wide Pub/Sub subscriber client."""
+    return pubsub_v1.SubscriberClient()
+
+class AgentCapability(IntEnum):
+    """Standard agent capabilities for Project Pravaah.
+
+    Int-coded so registration documents and array_contains queries ship
+    a small integer instead of the full capability string; use `label`
+    for human-readable output.
+    """
+    PERCEPTION = 1
+    PREDICTION = 2
+    DECISION_MAKING = 3
+    COMMUNICATION = 4
+    TRAFFIC_MONITORING = 5
+    TELEMETRY_INGESTION = 6
+    CONGESTION_PREDICTION = 7
+    STRATEGIC_PLANNING = 8
+    NOTIFICATION_DELIVERY = 9
+
+    @property
+    def label(self) -> str:
+        """Human-readable capability name for logs and status payloads."""
+        return self.name.lower()
 
 class MessageType(Enum):
     """A2A message types."""
@@ -44,7 +108,7 @@ class MessageType(Enum):
     EVENT = "event"
     HEARTBEAT = "heartbeat"
 
-@dataclass
+@dataclass(slots=True)
 class A2AMessage:
     """Agent-to-Agent message structure."""
     message_id: str
@@ -57,16 +121,29 @@ class A2AMessage:
     timestamp: str
     ttl: int = 300  # 5 minutes default TTL
     
-    def to_dict(self) -> Dict[str, Any]:
-        """Convert message to dictionary."""
-        return asdict(self)
-    
+    # Wire format: a positional orjson array rather than a keyed object,
+    # so field names are not repeated on every send. Field order is part
+    # of the wire contract - append new fields, never reorder.
+    def encode(self) -> bytes:
+        """Serialize message to compact wire bytes."""
+        return orjson.dumps(
+            (self.message_id, self.sender, self.receiver,
+             self.message_type.value, self.action, self.payload,
+             self.correlation_id, self.timestamp, self.ttl),
+            default=lambda o: o.value if isinstance(o, Enum) else o.__dict__
+        )
+
     @classmethod
-    def from_dict(cls, data: Dict[str, Any]) -> 'A2AMessage':
-        """Create message from dictionary."""
-        return cls(**data)
+    def decode(cls, data: bytes) -> 'A2AMessage':
+        """Create message from wire bytes (accepts the older keyed form)."""
+        fields = orjson.loads(data)
+        if isinstance(fields, dict):
+            fields['message_type'] = MessageType(fields['message_type'])
+            return cls(**fields)
+        return cls(fields[0], fields[1], fields[2], MessageType(fields[3]),
+                   fields[4], fields[5], fields[6], fields[7], fields[8])
 
-@dataclass
+@dataclass(slots=True)
 class AgentCapabilityInfo:
     """Agent capability information."""
     capability: AgentCapability
@@ -75,7 +152,15 @@ class AgentCapabilityInfo:
     input_schema: Dict[str, Any]
     output_schema: Dict[str, Any]
 
-@dataclass
+@dataclass(slots=True)
+class AgentRef:
+    """Lightweight agent reference returned by discovery queries."""
+    agent_id: str
+    name: str
+    endpoint: str
+    status: str
+
+@dataclass(slots=True)
 class AgentRegistration:
     """Agent registration information."""
     agent_id: str
@@ -86,18 +171,93 @@ class AgentRegistration:
     last_heartbeat: str
     metadata: Dict[str, Any]
 
+    def to_firestore_dict(self) -> Dict[str, Any]:
+        """Build the registry document without asdict's recursive deep copy."""
+        return {
+            'agent_id': self.agent_id,
+            'name': self.name,
+            'capabilities': [
+                {
+                    'capability': info.capability.value,
+                    'version': info.version,
+                    'description': info.description,
+                    'input_schema': info.input_schema,
+                    'output_schema': info.output_schema
+                }
+                for info in self.capabilities
+            ],
+            # Flat int array for array_contains discovery - the query
+            # compares whole array elements, so the nested capability
+            # maps above can never match a bare enum value
+            'capability_ids': [info.capability.value for info in self.capabilities],
+            'endpoint': self.endpoint,
+            'status': self.status,
+            'last_heartbeat': self.last_heartbeat,
+            'metadata': self.metadata
+        }
+
+    @classmethod
+    def from_firestore_dict(cls, data: Dict[str, Any]) -> 'AgentRegistration':
+        """Reconstruct a registration from its registry document."""
+        return cls(
+            agent_id=data['agent_id'],
+            name=data['name'],
+            capabilities=[
+                AgentCapabilityInfo(
+                    capability=AgentCapability(info['capability']),
+                    version=info['version'],
+                    description=info['description'],
+                    input_schema=info.get('input_schema', {}),
+                    output_schema=info.get('output_schema', {})
+                )
+                for info in data.get('capabilities', [])
+            ],
+            endpoint=data['endpoint'],
+            status=data['status'],
+            last_heartbeat=data['last_heartbeat'],
+            metadata=data.get('metadata', {})
+        )
+
+# Prefer libyaml's C loader; pure-Python yaml.safe_load is ~10x slower
+_YAML_LOADER = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+@functools.lru_cache(maxsize=8)
+def _read_config(path: str, mtime: float) -> Dict[str, Any]:
+    """Parse a config file, memoized on (path, mtime).
+
+    Every PravaahAgent constructs an ADKConfig, so without the cache a
+    multi-agent process re-parses the same file per agent - a cold-start
+    cost that matters on serverless. JSON configs go through orjson;
+    YAML falls back to the fastest available loader.
+    """
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if path.endswith(('.yaml', '.yml')):
+        return yaml.load(raw, Loader=_YAML_LOADER)
+    return orjson.loads(raw)
+
 class ADKConfig:
     """ADK configuration manager."""
-    
+
     def __init__(self, config_path: str = "adk_config.yaml"):
         self.config_path = config_path
         self.config = self._load_config()
-        
+
+        # Hot-path lookups resolved once at load time instead of a
+        # split-and-walk per get() call
+        self.project_id = self.config.get('project_id')
+        self.region = self.config.get('region')
+        registry_config = self.config.get('agent_registry') or {}
+        self.agent_collection = registry_config.get('collection', 'agent_registry')
+        messaging_config = self.config.get('messaging') or {}
+        self.topic = messaging_config.get('topic', 'pravaah-agent-messages')
+        self.subscription_prefix = messaging_config.get('subscription_prefix', 'pravaah-agent-')
+        self.ack_deadline = messaging_config.get('ack_deadline', 600)
+
     def _load_config(self) -> Dict[str, Any]:
-        """Load ADK configuration from YAML file."""
+        """Load ADK configuration (JSON or YAML) via the mtime-keyed cache."""
         try:
-            with open(self.config_path, 'r') as f:
-                return yaml.safe_load(f)
+            return _read_config(self.config_path, os.path.getmtime(self.config_path))
         except Exception as e:
             logger.error(f"Failed to load ADK config: {e}")
             return self._default_config()
@@ -124,16 +284,22 @@ class AgentRegistry:
     
     def __init__(self, config: ADKConfig):
         self.config = config
-        self.firestore_client = firestore.Client(
-            project=config.get('project_id')
-        )
-        self.collection_name = config.get('agent_registry.collection', 'agent_registry')
-        
+        # Async client so registry calls don't block the event loop for
+        # the full Firestore round-trip
+        self.firestore_client = _get_async_firestore_client(config.project_id)
+        self.collection_name = config.agent_collection
+
+        # Capability -> registrations cache; the mapping only changes on
+        # heartbeat cadence, so a short TTL removes the Firestore query
+        # from the per-message discovery hot path
+        self._discovery_cache: TTLCache = TTLCache(maxsize=32, ttl=15)
+
     async def register_agent(self, registration: AgentRegistration) -> bool:
         """Register an agent in the registry."""
         try:
             doc_ref = self.firestore_client.collection(self.collection_name).document(registration.agent_id)
-            doc_ref.set(asdict(registration))
+            await doc_ref.set(registration.to_firestore_dict())
+            self._discovery_cache.clear()
             logger.info(f"Agent {registration.agent_id} registered successfully")
             return True
         except Exception as e:
@@ -144,27 +310,39 @@ class AgentRegistry:
         """Unregister an agent from the registry."""
         try:
             doc_ref = self.firestore_client.collection(self.collection_name).document(agent_id)
-            doc_ref.delete()
+            await doc_ref.delete()
+            self._discovery_cache.clear()
             logger.info(f"Agent {agent_id} unregistered successfully")
             return True
         except Exception as e:
             logger.error(f"Failed to unregister agent {agent_id}: {e}")
             return False
     
-    async def discover_agents_by_capability(self, capability: AgentCapability) -> List[AgentRegistration]:
-        """Discover agents by capability."""
+    async def discover_agents_by_capability(self, capability: AgentCapability) -> List[AgentRef]:
+        """Discover agents by capability.
+
+        Returns lightweight `AgentRef` objects; the projection keeps the
+        nested capability schemas and metadata server-side. Callers that
+        need the full registration should follow up with `get_agent`.
+        """
         try:
+            cached = self._discovery_cache.get(capability.value)
+            if cached is not None:
+                return list(cached)
+
             docs = self.firestore_client.collection(self.collection_name)\
-                .where('capabilities', 'array_contains', capability.value)\
+                .where('capability_ids', 'array_contains', capability.value)\
                 .where('status', '==', 'active')\
+                .select(['agent_id', 'name', 'endpoint', 'status'])\
                 .stream()
-            
+
             agents = []
-            for doc in docs:
+            async for doc in docs:
                 data = doc.to_dict()
-                agents.append(AgentRegistration(**data))
-            
-            return agents
+                agents.append(AgentRef(**data))
+
+            self._discovery_cache[capability.value] = agents
+            return list(agents)
         except Exception as e:
             logger.error(f"Failed to discover agents by capability {capability}: {e}")
             return []
@@ -173,9 +351,9 @@ class AgentRegistry:
         """Get agent registration by ID."""
         try:
             doc_ref = self.firestore_client.collection(self.collection_name).document(agent_id)
-            doc = doc_ref.get()
+            doc = await doc_ref.get()
             if doc.exists:
-                return AgentRegistration(**doc.to_dict())
+                return AgentRegistration.from_firestore_dict(doc.to_dict())
             return None
         except Exception as e:
             logger.error(f"Failed to get agent {agent_id}: {e}")
@@ -183,24 +361,46 @@ class AgentRegistry:
 
 class A2AMessaging:
     """A2A messaging system using Pub/Sub."""
-    
+
+    # Matches FlowControl max_messages so the subscriber lease caps what
+    # can pile up in the inbox
+    INBOX_SIZE = 50
+
+    # Threads servicing Pub/Sub callbacks; the client default is
+    # unbounded relative to load
+    CALLBACK_WORKERS = 8
+
     def __init__(self, config: ADKConfig, agent_id: str):
         self.config = config
         self.agent_id = agent_id
-        self.project_id = config.get('project_id')
-        self.topic_name = config.get('messaging.topic', 'pravaah-agent-messages')
+        self.project_id = config.project_id
+        self.topic_name = config.topic
+
+        # Bounded hand-off between the Pub/Sub callback thread and the
+        # event loop; the loop reference is captured in receive_messages
+        self.inbox: asyncio.Queue = asyncio.Queue(maxsize=self.INBOX_SIZE)
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
-        self.publisher = pubsub_v1.PublisherClient()
-        self.subscriber = pubsub_v1.SubscriberClient()
+        self.publisher = _get_publisher_client()
+        self.subscriber = _get_subscriber_client()
         
         self.topic_path = self.publisher.topic_path(self.project_id, self.topic_name)
-        self.subscription_name = f"{config.get('messaging.subscription_prefix', 'pravaah-agent-')}{agent_id}"
+        self.subscription_name = f"{config.subscription_prefix}{agent_id}"
         self.subscription_path = self.subscriber.subscription_path(self.project_id, self.subscription_name)
         
         self._ensure_topic_and_subscription()
     
     def _ensure_topic_and_subscription(self):
-        """Ensure topic and subscription exist."""
+        """Ensure topic and subscription exist.
+
+        In production the Pub/Sub resources are pre-provisioned by
+        `bootstrap_adk.py`, so existence is a deployment-time invariant
+        and agents skip the two admin RPCs on boot. Set
+        ADK_ENSURE_RESOURCES=1 (e.g. for local development) to create
+        resources on the fly.
+        """
+        if not os.environ.get('ADK_ENSURE_RESOURCES'):
+            return
         try:
             # Create topic if it doesn't exist
             try:
@@ -215,7 +415,11 @@ class A2AMessaging:
                     request={
                         "name": self.subscription_path,
                         "topic": self.topic_path,
-                        "ack_deadline_seconds": self.config.get('messaging.ack_deadline', 600)
+                        "ack_deadline_seconds": self.config.ack_deadline,
+                        "filter": (
+                            f'attributes.receiver="{self.agent_id}" '
+                            f'OR attributes.receiver="all"'
+                        )
                     }
                 )
                 logger.info(f"Created subscription: {self.subscription_path}")
@@ -225,55 +429,112 @@ class A2AMessaging:
         except Exception as e:
             logger.error(f"Failed to ensure topic/subscription: {e}")
     
+    @staticmethod
+    def _on_publish_done(future):
+        """Surface asynchronous publish failures without blocking the sender."""
+        if future.exception() is not None:
+            logger.error(f"Failed to publish message: {future.exception()}")
+
     async def send_message(self, message: A2AMessage) -> bool:
         """Send A2A message."""
         try:
-            message_data = json.dumps(message.to_dict()).encode('utf-8')
-            future = self.publisher.publish(self.topic_path, message_data)
-            message_id = future.result()
-            logger.info(f"Message sent: {message_id}")
+            # receiver/action ride as attributes so subscriptions filter
+            # server-side and only the addressed agent wakes up
+            future = self.publisher.publish(
+                self.topic_path,
+                message.encode(),
+                receiver=message.receiver,
+                action=message.action
+            )
+            if message.message_type == MessageType.REQUEST:
+                # Requests need confirmed delivery before awaiting a
+                # response; wrap the publish future so the wait yields
+                # instead of blocking the event loop
+                message_id = await asyncio.wrap_future(future)
+                logger.info(f"Message sent: {message_id}")
+            else:
+                # Fire-and-forget: let the publisher batch the RPC and
+                # report failures via callback instead of blocking on RTT
+                future.add_done_callback(self._on_publish_done)
             return True
         except Exception as e:
             logger.error(f"Failed to send message: {e}")
             return False
     
-    async def receive_messages(self, callback, timeout: int = 60):
-        """Receive A2A messages."""
+    async def receive_messages(self):
+        """Receive A2A messages into the bounded inbox.
+
+        The Pub/Sub callback runs on a client library thread, where
+        `asyncio.create_task` is not safe; messages are handed to the
+        event loop via `run_coroutine_threadsafe` and drained by the
+        agent's worker tasks.
+        """
+        self._loop = asyncio.get_running_loop()
+
         def message_callback(message):
             try:
-                data = json.loads(message.data.decode('utf-8'))
-                a2a_message = A2AMessage.from_dict(data)
-                
-                # Filter messages for this agent
-                if a2a_message.receiver == self.agent_id or a2a_message.receiver == "all":
-                    asyncio.create_task(callback(a2a_message))
-                
+                # Addressing is enforced server-side by the subscription
+                # filter, so everything delivered here is for this agent
+                a2a_message = A2AMessage.decode(message.data)
+                # Block this callback thread until the bounded inbox
+                # accepts the message - acking first would release the
+                # flow-control lease and let pending puts pile up
+                # unboundedly on the event loop. The ThreadScheduler
+                # pool absorbs the wait.
+                asyncio.run_coroutine_threadsafe(
+                    self.inbox.put(a2a_message), self._loop
+                ).result()
+
                 message.ack()
             except Exception as e:
                 logger.error(f"Failed to process message: {e}")
                 message.nack()
         
         try:
-            flow_control = pubsub_v1.types.FlowControl(max_messages=100)
+            # Bound both message count and bytes so bursty load cannot
+            # balloon subscriber memory; lease management caps redelivery
+            flow_control = pubsub_v1.types.FlowControl(
+                max_messages=self.INBOX_SIZE,
+                max_bytes=10 * 1024 * 1024,
+                max_lease_duration=300
+            )
+            scheduler = ThreadScheduler(
+                ThreadPoolExecutor(max_workers=self.CALLBACK_WORKERS)
+            )
             streaming_pull_future = self.subscriber.subscribe(
                 self.subscription_path,
                 callback=message_callback,
-                flow_control=flow_control
+                flow_control=flow_control,
+                scheduler=scheduler
             )
             
             logger.info(f"Listening for messages on {self.subscription_path}")
-            
+
+            # Park on the pull future in an executor thread: it only
+            # resolves on stream error or cancellation, and waiting on it
+            # directly would block the event loop - stalling the very
+            # inbox.put handoffs the callbacks are waiting on
             try:
-                streaming_pull_future.result(timeout=timeout)
-            except Exception:
+                await asyncio.get_running_loop().run_in_executor(
+                    None, streaming_pull_future.result
+                )
+            finally:
                 streaming_pull_future.cancel()
-                
+
         except Exception as e:
             logger.error(f"Failed to receive messages: {e}")
 
 class PravaahAgent(ABC):
     """Base ADK Agent class for Project Pravaah."""
-    
+
+    # Agents are long-lived and hot on the A2A path; slots make every
+    # attribute access an array lookup and drop the per-instance dict
+    # (subclasses must declare their own slots to keep the benefit)
+    __slots__ = (
+        "agent_id", "name", "capabilities", "config", "registry",
+        "messaging", "_work_sem", "status", "metadata", "metrics",
+    )
+
     def __init__(self, 
                  agent_id: str,
                  name: str,
@@ -289,6 +550,11 @@ class PravaahAgent(ABC):
         self.registry = AgentRegistry(self.config)
         self.messaging = A2AMessaging(self.config, agent_id)
         
+        # Caps concurrent on_message executions; workers block here when
+        # handlers are slow, which backs pressure up through the bounded
+        # inbox to Pub/Sub flow control
+        self._work_sem = asyncio.Semaphore(32)
+
         # Agent state
         self.status = "initializing"
         self.metadata = {}
@@ -322,6 +588,11 @@ class PravaahAgent(ABC):
     async def start(self):
         """Start the agent."""
         try:
+            # Flip status before on_start: agents spawn their periodic
+            # loop tasks there, and those loops gate on status == "active".
+            # The first await below would otherwise run them against
+            # "initializing" and they would exit immediately.
+            self.status = "active"
             await self.on_start()
             
             # Register agent
@@ -332,7 +603,7 @@ class PravaahAgent(ABC):
                     AgentCapabilityInfo(
                         capability=cap,
                         version="1.0.0",
-                        description=f"{cap.value} capability",
+                        description=f"{cap.label} capability",
                         input_schema={},
                         output_schema={}
                     ) for cap in self.capabilities
@@ -344,11 +615,11 @@ class PravaahAgent(ABC):
             )
             
             await self.registry.register_agent(registration)
-            self.status = "active"
-            
-            # Start message listening
+
+            # Start message listening and registry heartbeats
             asyncio.create_task(self._message_loop())
-            
+            asyncio.create_task(self._heartbeat_loop())
+
             logger.info(f"Agent {self.agent_id} started successfully")
             
         except Exception as e:
@@ -365,30 +636,89 @@ class PravaahAgent(ABC):
         except Exception as e:
             logger.error(f"Failed to stop agent {self.agent_id}: {e}")
     
+    # Worker tasks draining the messaging inbox concurrently
+    MESSAGE_WORKERS = 4
+
+    # Seconds between registry heartbeats
+    HEARTBEAT_INTERVAL = 10
+
+    async def _heartbeat_loop(self):
+        """Refresh registry liveness and flush metrics periodically.
+
+        Both writes go through the async client and are gathered, so the
+        pair costs max(RTT) rather than sum(RTT).
+        """
+        registry_client = self.registry.firestore_client
+        heartbeat_ref = registry_client.collection(
+            self.registry.collection_name).document(self.agent_id)
+        metrics_ref = registry_client.collection(
+            'agent_metrics').document(self.agent_id)
+
+        while self.status == "active":
+            await asyncio.sleep(self.HEARTBEAT_INTERVAL)
+            try:
+                now = datetime.now(timezone.utc).isoformat()
+                await asyncio.gather(
+                    heartbeat_ref.update({
+                        "last_heartbeat": now,
+                        "status": "active"
+                    }),
+                    metrics_ref.set({
+                        "agent_id": self.agent_id,
+                        "metrics": self.metrics,
+                        "updated_at": now
+                    }, merge=True)
+                )
+            except Exception as e:
+                logger.error(f"Heartbeat failed for agent {self.agent_id}: {e}")
+
     async def _message_loop(self):
         """Main message processing loop."""
-        await self.messaging.receive_messages(self._handle_message)
+        workers = [
+            asyncio.create_task(self._message_worker())
+            for _ in range(self.MESSAGE_WORKERS)
+        ]
+        try:
+            await self.messaging.receive_messages()
+        finally:
+            for worker in workers:
+                worker.cancel()
+
+    async def _message_worker(self):
+        """Drain the messaging inbox and dispatch to the handler."""
+        while True:
+            message = await self.messaging.inbox.get()
+            try:
+                await self._handle_message(message)
+            finally:
+                self.messaging.inbox.task_done()
     
     async def _handle_message(self, message: A2AMessage):
-        """Handle incoming A2A message."""
+        """Handle incoming A2A message.
+
+        The message was already acked in the Pub/Sub callback; handler
+        execution and the response send run under a bounded semaphore so
+        slow handlers throttle intake instead of piling up.
+        """
         try:
             self.metrics["messages_received"] += 1
             logger.info(f"Agent {self.agent_id} received message: {message.action} from {message.sender}")
-            
-            response = await self.on_message(message)
-            
-            if response and message.message_type == MessageType.REQUEST:
-                response_message = A2AMessage(
-                    message_id=str(uuid.uuid4()),
-                    sender=self.agent_id,
-                    receiver=message.sender,
-                    message_type=MessageType.RESPONSE,
-                    action=f"{message.action}_response",
-                    payload=response,
-                    correlation_id=message.correlation_id,
-                    timestamp=datetime.now(timezone.utc).isoformat()
-                )
-                await self.send_message(response_message)
+
+            async with self._work_sem:
+                response = await self.on_message(message)
+
+                if response and message.message_type == MessageType.REQUEST:
+                    response_message = A2AMessage(
+                        message_id=uuid.uuid4().hex,
+                        sender=self.agent_id,
+                        receiver=message.sender,
+                        message_type=MessageType.RESPONSE,
+                        action=f"{message.action}_response",
+                        payload=response,
+                        correlation_id=message.correlation_id,
+                        timestamp=datetime.now(timezone.utc).isoformat()
+                    )
+                    await self.send_message(response_message)
                 
         except Exception as e:
             logger.error(f"Error handling message in agent {self.agent_id}: {e}")
@@ -406,7 +736,7 @@ class PravaahAgent(ABC):
             self.metrics["errors"] += 1
             return False
     
-    async def discover_agents(self, capability: AgentCapability) -> List[AgentRegistration]:
+    async def discover_agents(self, capability: AgentCapability) -> List[AgentRef]:
         """Discover agents by capability."""
         return await self.registry.discover_agents_by_capability(capability)
     
@@ -416,7 +746,7 @@ class PravaahAgent(ABC):
             "agent_id": self.agent_id,
             "name": self.name,
             "status": self.status,
-            "capabilities": [cap.value for cap in self.capabilities],
+            "capabilities": [cap.label for cap in self.capabilities],
             "metrics": self.metrics,
             "metadata": self.metadata
         }
@@ -7,24 +7,30 @@ This agent uses Google ADK with A2A protocol and is optimized for GCP deployment
 """
 
 import os
-import json
+import time
 import uuid
 import asyncio
 import logging
+import secrets
+import itertools
+from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from typing import Dict, List, Any, Optional
 
 from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
 from google.api_core.exceptions import GoogleAPICallError
 import firebase_admin
 from firebase_admin import credentials, messaging
 
 # Import ADK base classes
 from adk_base import (
-    PravaahAgent, 
-    AgentCapability, 
-    A2AMessage, 
-    MessageType
+    PravaahAgent,
+    AgentCapability,
+    A2AMessage,
+    MessageType,
+    _get_async_firestore_client,
+    _now_iso
 )
 
 # Configure logging for GCP
@@ -34,6 +40,18 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class _AgentMetrics:
+    """Slotted metrics holder - counter bumps are attribute stores, not
+    dict hashes, and slots cut the per-instance memory."""
+    executions_completed: int = 0
+    firestore_updates: int = 0
+    notifications_sent: int = 0
+    reroutes_executed: int = 0
+    failed_operations: int = 0
+    last_execution: Optional[str] = None
+
+
 class ADKCommunicationsAgent(PravaahAgent):
     """
     ADK-Enhanced Communications Agent for Project Pravaah
@@ -44,8 +62,19 @@ class ADKCommunicationsAgent(PravaahAgent):
     - User communication management
     - GCP-optimized for Cloud Run deployment
     """
-    
-    def __init__(self, 
+
+    # FCM caps a MulticastMessage at 500 tokens
+    FCM_MULTICAST_LIMIT = 500
+
+    __slots__ = (
+        "project_id", "region", "_fcm_app", "_id_prefix", "_id_counter",
+        "firestore_client", "journeys_collection",
+        "notifications_collection", "_journeys", "_notifications",
+        "_reroute_sem", "_notif_queue", "_work", "_inflight",
+        "agent_metrics", "_handlers",
+    )
+
+    def __init__(self,
                  project_id: str = "stable-sign-454210-i0",
                  region: str = "asia-south1"):
         
@@ -61,26 +90,60 @@ class ADKCommunicationsAgent(PravaahAgent):
         
         self.project_id = project_id
         self.region = region
+
+        # Shared firebase_admin app for FCM; created in _initialize_fcm
+        self._fcm_app = None
+
+        # Internal correlation IDs come from a counter instead of
+        # uuid4's urandom read + formatting; the random prefix keeps IDs
+        # unique across restarts
+        self._id_prefix = secrets.token_hex(4)
+        self._id_counter = itertools.count()
+
+        # Initialize Google Cloud services (async client keeps Firestore
+        # RPCs off the event loop without thread hand-offs)
+        self.firestore_client = _get_async_firestore_client(project_id)
         
-        # Initialize Google Cloud services
-        self.firestore_client = firestore.Client(project=project_id)
-        
-        # Collections
+        # Collections (references bound once; .collection() allocates a
+        # new CollectionReference per call)
         self.journeys_collection = "journeys"
         self.notifications_collection = "notifications"
+        self._journeys = self.firestore_client.collection(self.journeys_collection)
+        self._notifications = self.firestore_client.collection(self.notifications_collection)
+
+        # Caps concurrent per-journey work during interventions so a large
+        # fan-out cannot exhaust the to_thread pool
+        self._reroute_sem = asyncio.Semaphore(20)
+
+        # Notification-tracking docs are buffered here and flushed in
+        # batches off the send hot path; producers set the event so the
+        # flush loop wakes only when there is work
+        self._notif_queue: asyncio.Queue = asyncio.Queue()
+        self._work = asyncio.Event()
+
+        # In-flight reroute executions keyed by (journey_id, route);
+        # duplicate requests during a burst share one execution
+        self._inflight: Dict[Any, asyncio.Task] = {}
         
         # Agent-specific metrics
-        self.agent_metrics = {
-            "executions_completed": 0,
-            "firestore_updates": 0,
-            "notifications_sent": 0,
-            "reroutes_executed": 0,
-            "failed_operations": 0,
-            "last_execution": None
+        self.agent_metrics = _AgentMetrics()
+
+        # O(1) action dispatch for on_message
+        self._handlers = {
+            "execute_reroute_and_notify": self._handle_execute_reroute_and_notify,
+            "execute_intervention": self._handle_execute_intervention,
+            "send_notification": self._handle_send_notification,
+            "update_journey_status": self._handle_update_journey_status,
+            "broadcast_alert": self._handle_broadcast_alert,
+            "health_check": self._handle_health_check
         }
-        
+
         logger.info(f"ADK CommunicationsAgent initialized for project: {project_id}")
-    
+
+    def _new_id(self) -> str:
+        """Cheap internal ID: agent-id prefix plus a process-unique counter."""
+        return f"{self.agent_id}-{self._id_prefix}{next(self._id_counter):x}"
+
     async def on_start(self):
         """ADK lifecycle hook - called when agent starts."""
         try:
@@ -103,8 +166,9 @@ class ADKCommunicationsAgent(PravaahAgent):
         """ADK lifecycle hook - called when agent stops."""
         try:
             logger.info("ADK CommunicationsAgent stopping...")
-            # Cleanup resources if needed
-            
+            # Flush any buffered notification docs before shutdown
+            await self._flush_notification_queue()
+
         except Exception as e:
             logger.error(f"Error stopping ADK CommunicationsAgent: {e}")
     
@@ -115,36 +179,21 @@ class ADKCommunicationsAgent(PravaahAgent):
             payload = message.payload
             
             logger.info(f"CommunicationsAgent processing A2A message: {action}")
-            
-            if action == "execute_reroute_and_notify":
-                return await self._handle_execute_reroute_and_notify(payload)
-            
-            elif action == "execute_intervention":
-                return await self._handle_execute_intervention(payload)
-            
-            elif action == "send_notification":
-                return await self._handle_send_notification(payload)
-            
-            elif action == "update_journey_status":
-                return await self._handle_update_journey_status(payload)
-            
-            elif action == "broadcast_alert":
-                return await self._handle_broadcast_alert(payload)
-            
-            elif action == "health_check":
-                return await self._handle_health_check(payload)
-            
-            else:
+
+            handler = self._handlers.get(action)
+            if handler is None:
                 logger.warning(f"Unknown action: {action}")
                 return {
                     "success": False,
                     "error": f"Unknown action: {action}",
                     "agent_id": self.agent_id
                 }
-                
+
+            return await handler(payload)
+
         except Exception as e:
             logger.error(f"Error handling A2A message: {e}")
-            self.agent_metrics["errors"] += 1
+            self.agent_metrics.failed_operations += 1
             return {
                 "success": False,
                 "error": str(e),
@@ -157,7 +206,7 @@ class ADKCommunicationsAgent(PravaahAgent):
             journey_id = payload.get("journey_id")
             new_route_data = payload.get("new_route_data", {})
             reason_for_change = payload.get("reason_for_change", "Traffic optimization")
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Execute reroute and notify
             execution_result = await self.execute_reroute_and_notify({
@@ -166,15 +215,15 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "reason_for_change": reason_for_change
             })
             
-            self.agent_metrics["executions_completed"] += 1
-            self.agent_metrics["last_execution"] = datetime.now(timezone.utc).isoformat()
+            self.agent_metrics.executions_completed += 1
+            self.agent_metrics.last_execution = _now_iso()
             
             return {
                 "success": True,
                 "correlation_id": correlation_id,
                 "execution_result": execution_result,
                 "journey_id": journey_id,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -191,7 +240,7 @@ class ADKCommunicationsAgent(PravaahAgent):
         try:
             intervention_type = payload.get("intervention_type", "REROUTE")
             decision_result = payload.get("decision_result", {})
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Execute intervention based on type
             intervention_result = await self._execute_intervention_by_type(intervention_type, decision_result)
@@ -201,7 +250,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "correlation_id": correlation_id,
                 "intervention_result": intervention_result,
                 "intervention_type": intervention_type,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -217,7 +266,7 @@ class ADKCommunicationsAgent(PravaahAgent):
         """Handle notification sending request via A2A."""
         try:
             notification_data = payload.get("notification_data", {})
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Send notification
             notification_result = await self._send_fcm_alert(notification_data)
@@ -226,7 +275,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "success": True,
                 "correlation_id": correlation_id,
                 "notification_result": notification_result,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -243,7 +292,7 @@ class ADKCommunicationsAgent(PravaahAgent):
         try:
             journey_id = payload.get("journey_id")
             new_status = payload.get("new_status", "UPDATED")
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Update journey status
             update_result = await self._update_journey_in_firestore(journey_id, {"status": new_status})
@@ -254,7 +303,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "update_result": update_result,
                 "journey_id": journey_id,
                 "new_status": new_status,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -271,7 +320,7 @@ class ADKCommunicationsAgent(PravaahAgent):
         try:
             alert_message = payload.get("alert_message", "Traffic alert")
             alert_type = payload.get("alert_type", "INFO")
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Broadcast alert
             broadcast_result = await self._broadcast_traffic_alert(alert_message, alert_type)
@@ -281,7 +330,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "correlation_id": correlation_id,
                 "broadcast_result": broadcast_result,
                 "alert_type": alert_type,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -300,14 +349,14 @@ class ADKCommunicationsAgent(PravaahAgent):
         return {
             "success": True,
             "status": "healthy",
-            "metrics": self.agent_metrics,
+            "metrics": asdict(self.agent_metrics),
             "firestore_status": firestore_status,
             "collections": {
                 "journeys": self.journeys_collection,
                 "notifications": self.notifications_collection
             },
-            "capabilities": [cap.value for cap in self.capabilities],
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "capabilities": [cap.label for cap in self.capabilities],
+            "timestamp": _now_iso(),
             "agent_id": self.agent_id
         }
     
@@ -315,9 +364,26 @@ class ADKCommunicationsAgent(PravaahAgent):
         """
         Execute reroute and notification with GCP optimization.
         Core method for journey rerouting and user notification.
+
+        Concurrent requests for the same journey and route share one
+        in-flight execution: duplicates await the first task's result
+        instead of repeating the Firestore and FCM round-trips.
         """
+        key = (
+            payload.get("journey_id"),
+            repr(sorted(payload.get("new_route_data", {}).items()))
+        )
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(self._do_execute_reroute_and_notify(payload))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t, k=key: self._inflight.pop(k, None))
+        return await task
+
+    async def _do_execute_reroute_and_notify(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Run one reroute + notification execution."""
         try:
-            execution_id = str(uuid.uuid4())
+            execution_id = self._new_id()
             journey_id = payload.get("journey_id")
             new_route_data = payload.get("new_route_data", {})
             reason_for_change = payload.get("reason_for_change", "Traffic optimization")
@@ -334,7 +400,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                     "status": "REROUTED",
                     "new_route": new_route_data,
                     "reroute_reason": reason_for_change,
-                    "rerouted_at": datetime.now(timezone.utc).isoformat(),
+                    "rerouted_at": firestore.SERVER_TIMESTAMP,
                     "rerouted_by": self.agent_id
                 }
             )
@@ -352,11 +418,11 @@ class ADKCommunicationsAgent(PravaahAgent):
             notification_result = await self._send_fcm_alert(notification_payload)
             
             # Update metrics
-            self.agent_metrics["reroutes_executed"] += 1
+            self.agent_metrics.reroutes_executed += 1
             if journey_update_result.get("success", False):
-                self.agent_metrics["firestore_updates"] += 1
+                self.agent_metrics.firestore_updates += 1
             if notification_result.get("success", False):
-                self.agent_metrics["notifications_sent"] += 1
+                self.agent_metrics.notifications_sent += 1
             
             execution_result = {
                 "execution_id": execution_id,
@@ -364,7 +430,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "journey_update": journey_update_result,
                 "notification": notification_result,
                 "status": "completed",
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             }
             
             logger.info(f"Reroute execution completed for journey {journey_id}")
@@ -373,47 +439,38 @@ class ADKCommunicationsAgent(PravaahAgent):
             
         except Exception as e:
             logger.error(f"Error in reroute execution: {e}")
-            self.agent_metrics["failed_operations"] += 1
+            self.agent_metrics.failed_operations += 1
             raise
     
     async def _update_journey_in_firestore(self, journey_id: str, update_data: Dict[str, Any]) -> Dict[str, Any]:
-        """Update journey document in Firestore with GCP optimization."""
+        """Create-or-update a journey document in a single RPC.
+
+        set(..., merge=True) gives upsert semantics, replacing the previous
+        get-then-write pair and its extra read round-trip per journey. This
+        also makes an existence cache unnecessary: there is no get() left to
+        skip, and the write itself is create-or-update either way.
+        """
         try:
-            # Check if journey exists
-            journey_ref = self.firestore_client.collection(self.journeys_collection).document(journey_id)
-            journey_doc = journey_ref.get()
-            
-            if not journey_doc.exists:
-                # Create new journey document if it doesn't exist
-                initial_journey_data = {
-                    "id": journey_id,
-                    "created_at": datetime.now(timezone.utc).isoformat(),
-                    "created_by": self.agent_id
-                }
-                initial_journey_data.update(update_data)
-                journey_ref.set(initial_journey_data)
-                
-                logger.info(f"Created new journey document: {journey_id}")
-                
-                return {
-                    "success": True,
-                    "action": "created",
-                    "journey_id": journey_id,
-                    "data": initial_journey_data
-                }
-            else:
-                # Update existing journey
-                journey_ref.update(update_data)
-                
-                logger.info(f"Updated journey document: {journey_id}")
-                
-                return {
-                    "success": True,
-                    "action": "updated",
-                    "journey_id": journey_id,
-                    "updates": update_data
-                }
-                
+            journey_ref = self._journeys.document(journey_id)
+
+            journey_data = {
+                "id": journey_id,
+                "updated_at": firestore.SERVER_TIMESTAMP,
+                "updated_by": self.agent_id
+            }
+            journey_data.update(update_data)
+
+            await journey_ref.set(journey_data, merge=True)
+
+            logger.info(f"Upserted journey document: {journey_id}")
+
+            return {
+                "success": True,
+                "action": "upserted",
+                "journey_id": journey_id,
+                "updates": update_data
+            }
+
         except Exception as e:
             logger.error(f"Error updating journey {journey_id} in Firestore: {e}")
             return {
@@ -428,20 +485,33 @@ class ADKCommunicationsAgent(PravaahAgent):
         Hackathon-friendly implementation with production-ready code.
         """
         try:
-            message_id = str(uuid.uuid4())
+            message_id = uuid.uuid4().hex
             journey_id = notification_payload.get("journey_id", "unknown")
             title = notification_payload.get("title", "Traffic Alert")
             message = notification_payload.get("message", "Traffic update available")
             notification_type = notification_payload.get("type", "INFO")
-            
-            # Hackathon-friendly: Console logging for demo
-            logger.info(f"FCM Alert Sent: {title} - {message} (Journey: {journey_id})")
-            print(f"🔔 FCM NOTIFICATION: {title}")
-            print(f"   Message: {message}")
-            print(f"   Journey ID: {journey_id}")
-            print(f"   Type: {notification_type}")
-            print(f"   Message ID: {message_id}")
-            
+            recipient_tokens = notification_payload.get("recipient_tokens", [])
+
+            if recipient_tokens and self._fcm_app is not None:
+                delivery = await self._send_fcm_multicast(
+                    recipient_tokens, title, message,
+                    {
+                        "journey_id": str(journey_id),
+                        "type": notification_type,
+                        "message_id": message_id
+                    }
+                )
+                method = "fcm_multicast"
+            else:
+                # Demo path: a single log line carries all fields; print()
+                # would take the stdout lock and flush per call
+                logger.info(
+                    f"FCM Alert Sent: {title} - {message} "
+                    f"(journey={journey_id}, type={notification_type}, message_id={message_id})"
+                )
+                delivery = None
+                method = "console_log_demo"
+
             # Store notification in Firestore for tracking
             notification_doc = {
                 "message_id": message_id,
@@ -450,50 +520,33 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "message": message,
                 "type": notification_type,
                 "status": "sent",
-                "sent_at": datetime.now(timezone.utc).isoformat(),
+                # Server-side sentinel: no client clock/format cost and the
+                # field stays queryable as a real timestamp
+                "sent_at": firestore.SERVER_TIMESTAMP,
                 "sent_by": self.agent_id,
                 "payload": notification_payload
             }
             
-            # Save to Firestore
-            notification_ref = self.firestore_client.collection(self.notifications_collection).document(message_id)
-            notification_ref.set(notification_doc)
+            # Queue for batched Firestore tracking write; the flush happens
+            # in the communication loop, off the send hot path
+            self._notif_queue.put_nowait(notification_doc)
+            self._work.set()
             
-            # Production-ready FCM code (commented for hackathon speed)
-            """
-            # Uncomment for production FCM integration
-            try:
-                fcm_message = messaging.Message(
-                    notification=messaging.Notification(
-                        title=title,
-                        body=message
-                    ),
-                    data={
-                        "journey_id": journey_id,
-                        "type": notification_type,
-                        "message_id": message_id
-                    },
-                    topic="traffic_alerts"  # Or use specific user tokens
-                )
-                
-                response = messaging.send(fcm_message)
-                logger.info(f"FCM message sent successfully: {response}")
-                
-            except Exception as fcm_error:
-                logger.error(f"FCM sending failed: {fcm_error}")
-            """
-            
-            return {
+            result = {
                 "success": True,
                 "message_id": message_id,
                 "journey_id": journey_id,
                 "title": title,
                 "message": message,
                 "type": notification_type,
-                "method": "console_log_demo",  # Change to "fcm" in production
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "method": method,
+                "timestamp": _now_iso()
             }
-            
+            if delivery is not None:
+                result["delivery"] = delivery
+
+            return result
+
         except Exception as e:
             logger.error(f"Error sending FCM alert: {e}")
             return {
@@ -501,11 +554,40 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "error": str(e),
                 "journey_id": notification_payload.get("journey_id", "unknown")
             }
+
+    async def _send_fcm_multicast(self, tokens: List[str], title: str, body: str,
+                                  data: Dict[str, str]) -> Dict[str, Any]:
+        """Send one notification to many device tokens over the shared app.
+
+        Tokens are chunked to the 500-token MulticastMessage limit; each
+        chunk rides a single HTTP/2 stream instead of one request per
+        token. The blocking SDK call runs off the event loop.
+        """
+        sent = 0
+        failed = 0
+        for start in range(0, len(tokens), self.FCM_MULTICAST_LIMIT):
+            chunk = tokens[start:start + self.FCM_MULTICAST_LIMIT]
+            multicast = messaging.MulticastMessage(
+                tokens=chunk,
+                notification=messaging.Notification(title=title, body=body),
+                data=data
+            )
+            try:
+                response = await asyncio.to_thread(
+                    messaging.send_each_for_multicast, multicast, app=self._fcm_app
+                )
+                sent += response.success_count
+                failed += response.failure_count
+            except Exception as e:
+                logger.error(f"FCM multicast chunk failed: {e}")
+                failed += len(chunk)
+
+        return {"tokens": len(tokens), "sent": sent, "failed": failed}
     
     async def _execute_intervention_by_type(self, intervention_type: str, decision_result: Dict[str, Any]) -> Dict[str, Any]:
         """Execute intervention based on type with GCP optimization."""
         try:
-            intervention_id = str(uuid.uuid4())
+            intervention_id = self._new_id()
             
             if intervention_type == "REROUTE":
                 # Execute reroute intervention
@@ -528,7 +610,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                     "status": "completed"
                 }
             
-            result["timestamp"] = datetime.now(timezone.utc).isoformat()
+            result["timestamp"] = _now_iso()
             return result
             
         except Exception as e:
@@ -540,23 +622,69 @@ class ADKCommunicationsAgent(PravaahAgent):
             }
     
     async def _execute_reroute_intervention(self, decision_result: Dict[str, Any], intervention_id: str) -> Dict[str, Any]:
-        """Execute reroute intervention."""
+        """Execute reroute intervention with one batched Firestore commit."""
         try:
-            # Get affected journeys (simulated for demo)
-            affected_journeys = ["journey_001", "journey_002", "journey_003"]
-            
-            reroute_results = []
+            # One indexed query returns all candidate journeys instead of
+            # N individual gets ('in' accepts at most 10 values)
+            affected_cells = decision_result.get("affected_cells")
+            query = self._journeys.where(filter=FieldFilter("status", "==", "ACTIVE"))
+            if affected_cells:
+                query = query.where(filter=FieldFilter("geohash", "in", affected_cells[:10]))
+            query = query.select(["id"]).limit(500)
+
+            affected_journeys = [doc.id async for doc in query.stream()]
+            if not affected_journeys:
+                # Demo fallback when the journeys collection is not seeded
+                affected_journeys = ["journey_001", "journey_002", "journey_003"]
+            new_route_data = {
+                "alternate_route": "Outer Ring Road",
+                "estimated_time_savings": "15 minutes"
+            }
+            reason_for_change = "Traffic congestion detected"
+
+            # One WriteBatch pipelines every journey mutation into a single
+            # commit RPC instead of a get+write round-trip per journey
+            # (Firestore allows up to 500 mutations per batch)
+            batch = self.firestore_client.batch()
             for journey_id in affected_journeys:
-                reroute_result = await self.execute_reroute_and_notify({
-                    "journey_id": journey_id,
-                    "new_route_data": {
-                        "alternate_route": "Outer Ring Road",
-                        "estimated_time_savings": "15 minutes"
-                    },
-                    "reason_for_change": "Traffic congestion detected"
-                })
-                reroute_results.append(reroute_result)
-            
+                journey_ref = self._journeys.document(journey_id)
+                batch.set(journey_ref, {
+                    "id": journey_id,
+                    "status": "REROUTED",
+                    "new_route": new_route_data,
+                    "reroute_reason": reason_for_change,
+                    "rerouted_at": firestore.SERVER_TIMESTAMP,
+                    "rerouted_by": self.agent_id
+                }, merge=True)
+
+            await batch.commit()
+            self.agent_metrics.firestore_updates += len(affected_journeys)
+
+            # Fan notifications out concurrently once the batch has landed,
+            # gated by the semaphore; one failed journey must not abort the
+            # rest of the intervention
+            async def _notify(journey_id: str) -> Dict[str, Any]:
+                async with self._reroute_sem:
+                    return await self._send_fcm_alert({
+                        "journey_id": journey_id,
+                        "title": "Route Updated",
+                        "message": f"Your journey has been rerouted due to {reason_for_change}",
+                        "type": "REROUTE",
+                        "new_route": new_route_data,
+                        "execution_id": intervention_id
+                    })
+
+            reroute_results = await asyncio.gather(
+                *[_notify(journey_id) for journey_id in affected_journeys],
+                return_exceptions=True
+            )
+
+            self.agent_metrics.reroutes_executed += len(affected_journeys)
+            self.agent_metrics.notifications_sent += sum(
+                1 for result in reroute_results
+                if isinstance(result, dict) and result.get("success", False)
+            )
+
             return {
                 "intervention_id": intervention_id,
                 "type": "REROUTE",
@@ -564,7 +692,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "reroute_results": reroute_results,
                 "status": "completed"
             }
-            
+
         except Exception as e:
             logger.error(f"Error in reroute intervention: {e}")
             return {"error": str(e)}
@@ -617,23 +745,61 @@ class ADKCommunicationsAgent(PravaahAgent):
             logger.error(f"Error in coordination intervention: {e}")
             return {"error": str(e)}
     
+    async def _stream_broadcast_tokens(self):
+        """Yield registered device tokens one page at a time.
+
+        Streaming keeps broadcast memory at O(multicast chunk) instead of
+        materializing every recipient before the first send.
+        """
+        query = self.firestore_client.collection("users").where(
+            filter=FieldFilter("fcm_token", ">", "")
+        ).select(["fcm_token"])
+        async for doc in query.stream():
+            token = doc.get("fcm_token")
+            if token:
+                yield token
+
     async def _broadcast_traffic_alert(self, alert_message: str, alert_type: str) -> Dict[str, Any]:
-        """Broadcast traffic alert to all users."""
+        """Broadcast traffic alert to all users.
+
+        Tokens stream straight into 500-token multicast chunks; the
+        aggregate counts are returned instead of per-recipient dicts.
+        """
         try:
-            broadcast_id = str(uuid.uuid4())
-            
-            # Broadcast via FCM (simulated for demo)
-            broadcast_payload = {
-                "broadcast_id": broadcast_id,
-                "title": f"Traffic Alert - {alert_type}",
-                "message": alert_message,
-                "type": alert_type
-            }
-            
-            notification_result = await self._send_fcm_alert(broadcast_payload)
-            
-            logger.info(f"Traffic alert broadcasted: {alert_type}")
-            
+            broadcast_id = self._new_id()
+            title = f"Traffic Alert - {alert_type}"
+            data = {"broadcast_id": broadcast_id, "type": alert_type}
+
+            sent = 0
+            failed = 0
+            if self._fcm_app is not None:
+                chunk: List[str] = []
+                async for token in self._stream_broadcast_tokens():
+                    chunk.append(token)
+                    if len(chunk) >= self.FCM_MULTICAST_LIMIT:
+                        delivery = await self._send_fcm_multicast(chunk, title, alert_message, data)
+                        sent += delivery["sent"]
+                        failed += delivery["failed"]
+                        chunk = []
+                if chunk:
+                    delivery = await self._send_fcm_multicast(chunk, title, alert_message, data)
+                    sent += delivery["sent"]
+                    failed += delivery["failed"]
+
+            if sent or failed:
+                self.agent_metrics.notifications_sent += sent
+                notification_result = {"success": True, "sent": sent, "failed": failed}
+            else:
+                # Demo fallback: no registered tokens, log the alert once
+                notification_result = await self._send_fcm_alert({
+                    "broadcast_id": broadcast_id,
+                    "title": title,
+                    "message": alert_message,
+                    "type": alert_type
+                })
+
+            logger.info(f"Traffic alert broadcasted: {alert_type} (sent={sent}, failed={failed})")
+
             return {
                 "success": True,
                 "broadcast_id": broadcast_id,
@@ -641,7 +807,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                 "message": alert_message,
                 "notification_result": notification_result
             }
-            
+
         except Exception as e:
             logger.error(f"Error broadcasting alert: {e}")
             return {"success": False, "error": str(e)}
@@ -657,7 +823,7 @@ class ADKCommunicationsAgent(PravaahAgent):
                     "authority": authority,
                     "message": f"Traffic intervention required: {decision_result.get('strategy', 'Unknown')}",
                     "status": "notified",
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _now_iso()
                 }
                 notifications_sent.append(notification)
                 
@@ -685,8 +851,8 @@ class ADKCommunicationsAgent(PravaahAgent):
             coordination_result = {
                 "success": True,
                 "actions_taken": coordination_actions,
-                "coordination_id": str(uuid.uuid4()),
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "coordination_id": self._new_id(),
+                "timestamp": _now_iso()
             }
             
             logger.info("Traffic authority coordination completed")
@@ -698,29 +864,39 @@ class ADKCommunicationsAgent(PravaahAgent):
             return {"success": False, "error": str(e)}
     
     async def _test_firestore_connectivity(self):
-        """Test Firestore connectivity for GCP deployment."""
+        """Test Firestore connectivity for GCP deployment.
+
+        A collections listing is one read-only RPC, replacing the old
+        write-then-delete probe that cost two RPCs on every cold start.
+        """
         try:
-            # Test Firestore connection
-            test_doc = self.firestore_client.collection("health_check").document("test")
-            test_doc.set({"test": True, "timestamp": datetime.now(timezone.utc).isoformat()})
-            
-            # Clean up test document
-            test_doc.delete()
-            
+            async for _ in self.firestore_client.collections():
+                break
+
             logger.info("Firestore connectivity test successful")
-            
+
         except Exception as e:
             logger.warning(f"Firestore connectivity test failed: {e}")
     
     async def _initialize_fcm(self):
-        """Initialize FCM for GCP deployment."""
+        """Initialize FCM for GCP deployment.
+
+        A single firebase_admin App is created once and reused for every
+        send, so all notifications share one HTTP/2 transport instead of
+        re-establishing a connection per call.
+        """
         try:
-            # FCM is initialized with Firebase Admin SDK
-            # For production, ensure FCM is properly configured
-            logger.info("FCM initialization ready (using console logging for demo)")
-            
+            try:
+                self._fcm_app = firebase_admin.get_app()
+            except ValueError:
+                self._fcm_app = firebase_admin.initialize_app(
+                    credentials.ApplicationDefault()
+                )
+            logger.info("FCM initialized with shared firebase_admin app")
+
         except Exception as e:
-            logger.warning(f"FCM initialization warning: {e}")
+            self._fcm_app = None
+            logger.warning(f"FCM initialization warning: {e} (console logging fallback)")
     
     async def _communication_loop(self):
         """Background communication processing loop for GCP deployment."""
@@ -729,29 +905,54 @@ class ADKCommunicationsAgent(PravaahAgent):
             
             while self.status == "active":
                 try:
-                    # Process pending communications
-                    await asyncio.sleep(60)  # Check every minute
-                    
-                    # Process any queued notifications or updates
+                    # Sleep until a producer queues work - no periodic
+                    # wakeups and no up-to-60s flush latency
+                    await self._work.wait()
+                    self._work.clear()
+
+                    # Short coalescing window so a burst of sends lands
+                    # in one batch instead of many small commits
+                    await asyncio.sleep(0.05)
+                    # No wall-clock deadline here: cancelling the drain
+                    # mid-flush would drop docs already popped off the
+                    # queue. Work is bounded by the 500-doc batch size
+                    # instead.
                     await self._process_pending_communications()
-                    
+
                 except Exception as e:
                     logger.error(f"Error in communication loop: {e}")
-                    await asyncio.sleep(120)  # Wait longer on error
+                    await asyncio.sleep(1)
             
         except Exception as e:
             logger.error(f"Communication loop failed: {e}")
     
     async def _process_pending_communications(self):
-        """Process pending communications and notifications."""
+        """Flush queued notification-tracking docs in batched commits."""
         try:
-            # This would process any queued communications in production
-            # For now, just update metrics
-            pass
-            
+            await self._flush_notification_queue()
+
         except Exception as e:
             logger.error(f"Error processing pending communications: {e}")
 
+    async def _flush_notification_queue(self):
+        """Drain the notification queue into 500-doc WriteBatch commits."""
+        while not self._notif_queue.empty():
+            batch = self.firestore_client.batch()
+            batched = 0
+            while batched < 500:
+                try:
+                    doc = self._notif_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                ref = self._notifications.document(doc["message_id"])
+                batch.set(ref, doc)
+                batched += 1
+
+            if batched:
+                await batch.commit()
+                self.agent_metrics.firestore_updates += batched
+                logger.info(f"Flushed {batched} notification docs to Firestore")
+
 # Factory function for creating ADK CommunicationsAgent
 async def create_adk_communications_agent(project_id: str = "stable-sign-454210-i0") -> ADKCommunicationsAgent:
     """Create and start ADK CommunicationsAgent for GCP deployment."""
@@ -7,14 +7,20 @@ This agent uses Google ADK with A2A protocol for standardized multi-agent coordi
 """
 
 import os
-import json
+import time
 import uuid
+import bisect
 import asyncio
+import statistics
 import logging
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
+from dataclasses import dataclass, asdict
 from typing import Dict, List, Any, Optional
 
+import orjson
+
 from google.cloud import firestore
+from google.cloud.firestore_v1.base_query import FieldFilter
 from google.cloud import pubsub_v1
 from google.api_core.exceptions import GoogleAPICallError
 import firebase_admin
@@ -22,16 +28,36 @@ from firebase_admin import credentials
 
 # Import ADK base classes
 from adk_base import (
-    PravaahAgent, 
-    AgentCapability, 
-    A2AMessage, 
-    MessageType
+    PravaahAgent,
+    AgentCapability,
+    A2AMessage,
+    MessageType,
+    _get_async_firestore_client,
+    _get_publisher_client,
+    _get_subscriber_client,
+    _now_iso
 )
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+@dataclass(slots=True)
+class _AgentMetrics:
+    """Slotted metrics holder - counter bumps are attribute stores, not
+    dict hashes, and slots cut the per-instance memory."""
+    telemetry_processed: int = 0
+    network_updates: int = 0
+    perception_cycles: int = 0
+    errors: int = 0
+    last_perception: Optional[str] = None
+
+
+# Speed thresholds (km/h) bounding the congestion buckets, kept sorted
+# for bisect
+_CONGESTION_LEVELS = ("high", "medium", "low")
+_CONGESTION_THRESHOLDS = (20.0, 40.0)
+
 class ADKObserverAgent(PravaahAgent):
     """
     ADK-Enhanced Observer Agent for Project Pravaah
@@ -42,7 +68,23 @@ class ADKObserverAgent(PravaahAgent):
     - Firestore data updates
     - A2A communication with other agents
     """
-    
+
+    # Seconds between checkpoints of the in-memory network state to
+    # Firestore (skipped entirely while the state is clean)
+    STATE_CHECKPOINT_INTERVAL = 10
+
+    # Max telemetry messages drained per Firestore WriteBatch commit
+    TELEMETRY_BATCH_SIZE = 200
+
+    __slots__ = (
+        "project_id", "region", "firestore_client", "publisher",
+        "_pull_count", "_sub_pool", "subscriber",
+        "telemetry_topic", "telemetry_subscription",
+        "network_state_collection", "journeys_collection",
+        "_capability_labels", "_state_doc", "_telemetry_col",
+        "_latest_state", "_state_dirty", "_state_lock", "_telemetry_queue",
+        "_streaming_futures", "_loop", "agent_metrics", "_status_template",
+    )
     def __init__(self, 
                  project_id: str = "stable-sign-454210-i0",
                  region: str = "asia-south1"):
@@ -61,30 +103,75 @@ class ADKObserverAgent(PravaahAgent):
         self.project_id = project_id
         self.region = region
         
-        # Initialize Google Cloud services
-        self.firestore_client = firestore.Client(project=project_id)
-        self.publisher = pubsub_v1.PublisherClient()
-        self.subscriber = pubsub_v1.SubscriberClient()
+        # Initialize Google Cloud services (async Firestore client: RPCs
+        # are awaitable and multiplex over one gRPC channel)
+        self.firestore_client = _get_async_firestore_client(project_id)
+        # Publisher is only used for topic admin during setup; the shared
+        # memoized client is plenty
+        self.publisher = _get_publisher_client()
+        # One streaming pull per subscriber client: each client owns its
+        # own gRPC channel, so N clients sidestep the per-stream
+        # throughput cap. The shared memoized client doubles as the
+        # admin client for topic/subscription setup.
+        self._pull_count = min(4, os.cpu_count() or 1)
+        self._sub_pool = [_get_subscriber_client()] + [
+            pubsub_v1.SubscriberClient() for _ in range(self._pull_count - 1)
+        ]
+        self.subscriber = self._sub_pool[0]
         
         # Agent-specific configuration
         self.telemetry_topic = "vehicle-telemetry"
+        self.telemetry_subscription = "vehicle-telemetry-observer"
         self.network_state_collection = "network_state"
         self.journeys_collection = "journeys"
+
+        # Capabilities never change after construction; cache the label
+        # list health checks return instead of rebuilding it per call
+        self._capability_labels = [cap.label for cap in self.capabilities]
+
+        # Network state lives in one fixed doc overwritten in place; the
+        # in-process copy serves reads since this agent is the sole writer
+        self._state_doc = self.firestore_client.collection(self.network_state_collection).document("current")
+
+        # Pre-bound collection ref: the client allocates and validates a
+        # fresh reference on every .collection() chain, so hot paths
+        # reuse this one
+        self._telemetry_col = self.firestore_client.collection("vehicle_telemetry")
+        self._latest_state: Optional[Dict[str, Any]] = None
+
+        # Dirty flag: set on every in-memory state update, cleared when
+        # the checkpoint loop persists the current value
+        self._state_dirty = False
+        # Single-flight guard for the cold-start state read
+        self._state_lock = asyncio.Lock()
+
+        # Streaming-pull handoff: the subscriber callback runs on a gRPC
+        # thread and feeds this queue; the ingestion loop drains it
+        self._telemetry_queue: asyncio.Queue = asyncio.Queue()
+        self._streaming_futures: List[Any] = []
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
         
         # Performance metrics
-        self.agent_metrics = {
-            "telemetry_processed": 0,
-            "network_updates": 0,
-            "perception_cycles": 0,
-            "errors": 0,
-            "last_perception": None
+        self.agent_metrics = _AgentMetrics()
+
+        # Static half of get_agent_status, built once; the per-call dict
+        # only merges in the mutable counters
+        self._status_template = {
+            "project_id": project_id,
+            "region": region,
+            "collections": {
+                "network_state": self.network_state_collection,
+                "journeys": self.journeys_collection
+            }
         }
         
         logger.info(f"ADK ObserverAgent initialized for project: {project_id}")
-    
+
     async def on_start(self):
         """ADK lifecycle hook - called when agent starts."""
         try:
+            self._loop = asyncio.get_running_loop()
+
             # Set up Pub/Sub topic and subscription
             await self._setup_pubsub()
             
@@ -93,6 +180,9 @@ class ADKObserverAgent(PravaahAgent):
             
             # Start background telemetry ingestion
             asyncio.create_task(self._telemetry_ingestion_loop())
+
+            # Periodically checkpoint the in-memory network state
+            asyncio.create_task(self._state_checkpoint_loop())
             
             logger.info("ADK ObserverAgent started successfully")
             
@@ -104,8 +194,12 @@ class ADKObserverAgent(PravaahAgent):
         """ADK lifecycle hook - called when agent stops."""
         try:
             logger.info("ADK ObserverAgent stopping...")
-            # Cleanup resources if needed
-            
+            # Stop the streaming pulls before flushing buffered work
+            for future in self._streaming_futures:
+                future.cancel()
+            # Persist the final network state before shutdown
+            await self._flush_state_writes()
+
         except Exception as e:
             logger.error(f"Error stopping ADK ObserverAgent: {e}")
     
@@ -139,7 +233,7 @@ class ADKObserverAgent(PravaahAgent):
                 
         except Exception as e:
             logger.error(f"Error handling A2A message: {e}")
-            self.agent_metrics["errors"] += 1
+            self.agent_metrics.errors += 1
             return {
                 "success": False,
                 "error": str(e),
@@ -149,7 +243,7 @@ class ADKObserverAgent(PravaahAgent):
     async def _handle_get_network_state(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle network state request via A2A."""
         try:
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", uuid.uuid4().hex)
             
             # Get current network state
             network_state = await self.get_network_state()
@@ -158,7 +252,7 @@ class ADKObserverAgent(PravaahAgent):
                 "success": True,
                 "correlation_id": correlation_id,
                 "network_state": network_state,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -174,17 +268,18 @@ class ADKObserverAgent(PravaahAgent):
         """Handle telemetry data request via A2A."""
         try:
             time_window = payload.get("time_window_minutes", 10)
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
-            
+            limit = payload.get("limit", 100)
+            correlation_id = payload.get("correlation_id", uuid.uuid4().hex)
+
             # Get recent telemetry data
-            telemetry_data = await self._get_recent_telemetry(time_window)
+            telemetry_data = await self._get_recent_telemetry(time_window, limit)
             
             return {
                 "success": True,
                 "correlation_id": correlation_id,
                 "telemetry_data": telemetry_data,
                 "time_window_minutes": time_window,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -199,19 +294,19 @@ class ADKObserverAgent(PravaahAgent):
     async def _handle_start_perception_cycle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle perception cycle start request via A2A."""
         try:
-            cycle_id = payload.get("cycle_id", str(uuid.uuid4()))
+            cycle_id = payload.get("cycle_id", uuid.uuid4().hex)
             
             # Start perception cycle
             perception_result = await self._run_perception_cycle(cycle_id)
             
-            self.agent_metrics["perception_cycles"] += 1
-            self.agent_metrics["last_perception"] = datetime.now(timezone.utc).isoformat()
+            self.agent_metrics.perception_cycles += 1
+            self.agent_metrics.last_perception = _now_iso()
             
             return {
                 "success": True,
                 "cycle_id": cycle_id,
                 "perception_result": perception_result,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -228,32 +323,41 @@ class ADKObserverAgent(PravaahAgent):
         return {
             "success": True,
             "status": "healthy",
-            "metrics": self.agent_metrics,
-            "capabilities": [cap.value for cap in self.capabilities],
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "metrics": asdict(self.agent_metrics),
+            "capabilities": self._capability_labels,
+            "timestamp": _now_iso(),
             "agent_id": self.agent_id
         }
     
     async def get_network_state(self) -> Dict[str, Any]:
-        """Get current network state from Firestore."""
+        """Get current network state, cached in-process.
+
+        The agent is the sole writer of network_state/current, so once
+        populated the local copy is authoritative and reads cost no RPC.
+        """
         try:
-            # Get latest network state document
-            network_docs = self.firestore_client.collection(self.network_state_collection)\
-                .order_by("timestamp", direction=firestore.Query.DESCENDING)\
-                .limit(1)\
-                .stream()
-            
-            for doc in network_docs:
-                network_data = doc.to_dict()
-                logger.info("Retrieved current network state from Firestore")
-                return network_data
-            
+            if self._latest_state is not None:
+                return self._latest_state
+
+            # Single-flight: concurrent cold-start callers queue on the
+            # lock and all but the first are served from the cache the
+            # winner populated
+            async with self._state_lock:
+                if self._latest_state is not None:
+                    return self._latest_state
+
+                snapshot = await self._state_doc.get()
+                if snapshot.exists:
+                    self._latest_state = snapshot.to_dict()
+                    logger.info("Retrieved current network state from Firestore")
+                    return self._latest_state
+
             # If no network state found, return default
             default_state = {
                 "active_vehicles": 0,
                 "average_speed": 0.0,
                 "congestion_level": "unknown",
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "source": "observer_agent_default"
             }
             
@@ -262,26 +366,24 @@ class ADKObserverAgent(PravaahAgent):
             
         except Exception as e:
             logger.error(f"Error retrieving network state: {e}")
-            self.agent_metrics["errors"] += 1
+            self.agent_metrics.errors += 1
             raise
     
-    async def _get_recent_telemetry(self, time_window_minutes: int = 10) -> List[Dict[str, Any]]:
+    async def _get_recent_telemetry(self, time_window_minutes: int = 10,
+                                    limit: int = 100) -> List[Dict[str, Any]]:
         """Get recent telemetry data from Firestore."""
         try:
             # Calculate time threshold
-            from datetime import timedelta
             threshold_time = datetime.now(timezone.utc) - timedelta(minutes=time_window_minutes)
-            
-            # Query recent telemetry
-            telemetry_docs = self.firestore_client.collection("vehicle_telemetry")\
-                .where("timestamp", ">=", threshold_time.isoformat())\
+
+            # A native datetime predicate hits the numeric timestamp index;
+            # comparing ISO strings is lexicographic and slower server-side
+            query = self._telemetry_col\
+                .where(filter=FieldFilter("timestamp", ">=", threshold_time))\
                 .order_by("timestamp", direction=firestore.Query.DESCENDING)\
-                .limit(100)\
-                .stream()
-            
-            telemetry_data = []
-            for doc in telemetry_docs:
-                telemetry_data.append(doc.to_dict())
+                .limit(limit)
+
+            telemetry_data = [doc.to_dict() async for doc in query.stream()]
             
             logger.info(f"Retrieved {len(telemetry_data)} telemetry records from last {time_window_minutes} minutes")
             return telemetry_data
@@ -293,24 +395,25 @@ class ADKObserverAgent(PravaahAgent):
     async def _run_perception_cycle(self, cycle_id: str) -> Dict[str, Any]:
         """Run a complete perception cycle."""
         try:
-            start_time = datetime.now(timezone.utc)
-            
-            # 1. Get current network state
-            network_state = await self.get_network_state()
-            
-            # 2. Get recent telemetry
-            telemetry_data = await self._get_recent_telemetry(5)  # Last 5 minutes
+            start = time.perf_counter()
+            
+            # 1+2. Network state and recent telemetry are independent;
+            # fetch both concurrently (state is usually the in-memory
+            # copy, so this mostly overlaps the telemetry RPC with it)
+            network_state, telemetry_data = await asyncio.gather(
+                self.get_network_state(),
+                self._get_recent_telemetry(5)  # Last 5 minutes
+            )
             
-            # 3. Analyze traffic patterns
-            traffic_analysis = await self._analyze_traffic_patterns(telemetry_data)
+            # 3. Analyze traffic patterns against the state fetched above
+            traffic_analysis = await self._analyze_traffic_patterns(telemetry_data, network_state)
             
             # 4. Update network state if needed
             if traffic_analysis.get("state_changed", False):
                 await self._update_network_state(traffic_analysis["new_state"])
-                self.agent_metrics["network_updates"] += 1
+                self.agent_metrics.network_updates += 1
             
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
+            duration = time.perf_counter() - start
             
             perception_result = {
                 "cycle_id": cycle_id,
@@ -318,7 +421,7 @@ class ADKObserverAgent(PravaahAgent):
                 "telemetry_count": len(telemetry_data),
                 "traffic_analysis": traffic_analysis,
                 "duration_seconds": duration,
-                "timestamp": end_time.isoformat()
+                "timestamp": _now_iso()
             }
             
             logger.info(f"Perception cycle {cycle_id} completed in {duration:.2f}s")
@@ -328,7 +431,8 @@ class ADKObserverAgent(PravaahAgent):
             logger.error(f"Error in perception cycle {cycle_id}: {e}")
             raise
     
-    async def _analyze_traffic_patterns(self, telemetry_data: List[Dict[str, Any]]) -> Dict[str, Any]:
+    async def _analyze_traffic_patterns(self, telemetry_data: List[Dict[str, Any]],
+                                        current_state: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Analyze traffic patterns from telemetry data."""
         try:
             if not telemetry_data:
@@ -337,20 +441,27 @@ class ADKObserverAgent(PravaahAgent):
                     "analysis": "No telemetry data available"
                 }
             
-            # Simple traffic analysis
+            # Single pass over the speeds; sorting once also gives the
+            # 15th percentile, which captures tail congestion the mean
+            # misses. fmean is C-implemented and numerically stabler
+            # than sum()/n
             total_vehicles = len(telemetry_data)
-            avg_speed = sum(t.get("speed", 0) for t in telemetry_data) / max(total_vehicles, 1)
-            
-            # Determine congestion level
-            if avg_speed < 20:
-                congestion_level = "high"
-            elif avg_speed < 40:
-                congestion_level = "medium"
+            if total_vehicles == 1:
+                avg_speed = p15_speed = telemetry_data[0].get("speed", 0.0)
             else:
-                congestion_level = "low"
+                speeds = sorted(t.get("speed", 0.0) for t in telemetry_data)
+                avg_speed = statistics.fmean(speeds)
+                p15_speed = speeds[(15 * (total_vehicles - 1)) // 100]
+
+            # Branchless congestion pick: bisect the mean speed into the
+            # threshold-sorted severity buckets
+            congestion_level = _CONGESTION_LEVELS[
+                bisect.bisect_right(_CONGESTION_THRESHOLDS, avg_speed)
+            ]
             
             # Check if state changed significantly
-            current_state = await self.get_network_state()
+            if current_state is None:
+                current_state = await self.get_network_state()
             state_changed = (
                 abs(current_state.get("active_vehicles", 0) - total_vehicles) > 5 or
                 current_state.get("congestion_level") != congestion_level
@@ -361,8 +472,9 @@ class ADKObserverAgent(PravaahAgent):
                 "analysis": {
                     "total_vehicles": total_vehicles,
                     "average_speed": avg_speed,
+                    "p15_speed": p15_speed,
                     "congestion_level": congestion_level,
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _now_iso()
                 }
             }
             
@@ -371,7 +483,7 @@ class ADKObserverAgent(PravaahAgent):
                     "active_vehicles": total_vehicles,
                     "average_speed": avg_speed,
                     "congestion_level": congestion_level,
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": _now_iso(),
                     "source": "observer_agent_analysis"
                 }
             
@@ -382,20 +494,46 @@ class ADKObserverAgent(PravaahAgent):
             return {"state_changed": False, "error": str(e)}
     
     async def _update_network_state(self, new_state: Dict[str, Any]):
-        """Update network state in Firestore."""
+        """Apply a state update in memory and mark it for checkpointing."""
         try:
-            doc_ref = self.firestore_client.collection(self.network_state_collection).document()
-            doc_ref.set(new_state)
-            logger.info("Network state updated in Firestore")
-            
+            self._latest_state = new_state
+            self._state_dirty = True
+
         except Exception as e:
             logger.error(f"Error updating network state: {e}")
             raise
+
+    async def _flush_state_writes(self):
+        """Checkpoint the in-memory network state if it has changed.
+
+        Intermediate states since the last checkpoint are superseded by
+        the current one, so a flush is a single in-place set() RPC no
+        matter how many updates accumulated.
+        """
+        if not self._state_dirty or self._latest_state is None:
+            return
+        self._state_dirty = False
+        await self._state_doc.set(self._latest_state)
+        logger.info("Network state checkpointed to Firestore")
+
+    async def _state_checkpoint_loop(self):
+        """Background loop persisting dirty network state every few seconds."""
+        try:
+            while self.status == "active":
+                await asyncio.sleep(self.STATE_CHECKPOINT_INTERVAL)
+                try:
+                    await self._flush_state_writes()
+                except Exception as e:
+                    logger.error(f"Error checkpointing network state: {e}")
+
+        except Exception as e:
+            logger.error(f"State checkpoint loop failed: {e}")
     
     async def _setup_pubsub(self):
-        """Set up Pub/Sub topic and subscription for telemetry."""
+        """Set up the telemetry topic and start the streaming pull."""
         try:
             topic_path = self.publisher.topic_path(self.project_id, self.telemetry_topic)
+            sub_path = self.subscriber.subscription_path(self.project_id, self.telemetry_subscription)
             
             # Create topic if it doesn't exist
             try:
@@ -404,46 +542,95 @@ class ADKObserverAgent(PravaahAgent):
             except Exception:
                 logger.info(f"Pub/Sub topic already exists: {topic_path}")
             
+            # Create subscription if it doesn't exist
+            try:
+                self.subscriber.create_subscription(request={"name": sub_path, "topic": topic_path})
+                logger.info(f"Created Pub/Sub subscription: {sub_path}")
+            except Exception:
+                logger.info(f"Pub/Sub subscription already exists: {sub_path}")
+            
+            # Streaming pull: messages are pushed to us as they arrive,
+            # with flow control bounding what each stream has outstanding.
+            # Every client in the pool opens its own pull on its own
+            # channel; all callbacks feed the same queue.
+            flow_control = pubsub_v1.types.FlowControl(
+                max_messages=1000,
+                max_bytes=50 * 1024 * 1024
+            )
+            self._streaming_futures = [
+                client.subscribe(
+                    sub_path,
+                    callback=self._on_telemetry_message,
+                    flow_control=flow_control
+                )
+                for client in self._sub_pool
+            ]
+            logger.info(f"{len(self._streaming_futures)} streaming pulls started on {sub_path}")
+            
         except Exception as e:
             logger.error(f"Error setting up Pub/Sub: {e}")
     
     async def _initialize_firestore_collections(self):
         """Initialize Firestore collections with default documents if needed."""
         try:
-            # Check if network_state collection has any documents
-            network_docs = list(self.firestore_client.collection(self.network_state_collection).limit(1).stream())
-            
-            if not network_docs:
-                # Create initial network state
+            # Seed the fixed current-state doc if it does not exist yet
+            snapshot = await self._state_doc.get()
+            if snapshot.exists:
+                self._latest_state = snapshot.to_dict()
+            else:
                 initial_state = {
                     "active_vehicles": 0,
                     "average_speed": 0.0,
                     "congestion_level": "unknown",
-                    "timestamp": datetime.now(timezone.utc).isoformat(),
+                    "timestamp": _now_iso(),
                     "source": "observer_agent_initialization"
                 }
-                
-                doc_ref = self.firestore_client.collection(self.network_state_collection).document()
-                doc_ref.set(initial_state)
+
+                await self._state_doc.set(initial_state)
+                self._latest_state = initial_state
                 logger.info("Initialized network_state collection")
             
         except Exception as e:
             logger.error(f"Error initializing Firestore collections: {e}")
     
+    def _on_telemetry_message(self, message):
+        """Subscriber callback - runs on a gRPC thread, not the event loop.
+
+        Hands the raw payload to the ingestion loop's queue; decoding
+        and Firestore writes happen on the loop so the callback stays
+        cheap and the flow-control window keeps draining.
+        """
+        try:
+            self._loop.call_soon_threadsafe(self._telemetry_queue.put_nowait, message.data)
+            message.ack()
+        except Exception as e:
+            logger.error(f"Error handing off telemetry message: {e}")
+            message.nack()
+
     async def _telemetry_ingestion_loop(self):
-        """Background loop for telemetry ingestion."""
+        """Drain streamed telemetry from the queue in Firestore-sized batches."""
         try:
             logger.info("Starting telemetry ingestion loop")
             
             while self.status == "active":
                 try:
-                    # Simulate telemetry ingestion
-                    # In production, this would pull from actual Pub/Sub subscription
-                    await asyncio.sleep(30)  # Check every 30 seconds
+                    # Block until something arrives, then sweep whatever
+                    # else is already queued (up to one WriteBatch worth)
+                    try:
+                        batch_data = [await asyncio.wait_for(self._telemetry_queue.get(), timeout=30)]
+                    except asyncio.TimeoutError:
+                        # Quiet period - still flush buffered state writes
+                        await self._flush_state_writes()
+                        continue
                     
-                    # Process any pending telemetry
-                    await self._process_pending_telemetry()
+                    while len(batch_data) < self.TELEMETRY_BATCH_SIZE and not self._telemetry_queue.empty():
+                        batch_data.append(self._telemetry_queue.get_nowait())
                     
+                    await self._process_pending_telemetry(batch_data)
+
+                    # Flush any buffered network state updates
+                    await self._flush_state_writes()
+
                 except Exception as e:
                     logger.error(f"Error in telemetry ingestion loop: {e}")
                     await asyncio.sleep(60)  # Wait longer on error
@@ -451,12 +638,38 @@ class ADKObserverAgent(PravaahAgent):
         except Exception as e:
             logger.error(f"Telemetry ingestion loop failed: {e}")
     
-    async def _process_pending_telemetry(self):
-        """Process pending telemetry data."""
+    async def _process_pending_telemetry(self, batch_data: List[bytes]):
+        """Decode a drained batch of telemetry and persist it in one WriteBatch."""
         try:
-            # This is a placeholder for actual telemetry processing
-            # In production, this would process real vehicle telemetry data
-            self.agent_metrics["telemetry_processed"] += 1
+            batch = self.firestore_client.batch()
+            written = 0
+            for raw in batch_data:
+                try:
+                    record = orjson.loads(raw)
+                except orjson.JSONDecodeError:
+                    logger.warning("Skipping undecodable telemetry message")
+                    continue
+                record.setdefault("ingested_at", firestore.SERVER_TIMESTAMP)
+                # Normalize the producer timestamp to a native datetime:
+                # Firestore comparisons never match across types, so a
+                # string/number here would hide the record from the typed
+                # range predicate in _get_recent_telemetry
+                ts = record.get("timestamp")
+                if isinstance(ts, str):
+                    try:
+                        record["timestamp"] = datetime.fromisoformat(ts.replace("Z", "+00:00"))
+                    except ValueError:
+                        record["timestamp"] = firestore.SERVER_TIMESTAMP
+                elif isinstance(ts, (int, float)):
+                    record["timestamp"] = datetime.fromtimestamp(ts, tz=timezone.utc)
+                elif not isinstance(ts, datetime):
+                    record["timestamp"] = firestore.SERVER_TIMESTAMP
+                batch.set(self._telemetry_col.document(), record)
+                written += 1
+            
+            if written:
+                await batch.commit()
+            self.agent_metrics.telemetry_processed += written
             
         except Exception as e:
             logger.error(f"Error processing telemetry: {e}")
@@ -464,15 +677,8 @@ class ADKObserverAgent(PravaahAgent):
     def get_agent_status(self) -> Dict[str, Any]:
         """Get comprehensive agent status."""
         base_status = self.get_status()
-        base_status.update({
-            "agent_metrics": self.agent_metrics,
-            "project_id": self.project_id,
-            "region": self.region,
-            "collections": {
-                "network_state": self.network_state_collection,
-                "journeys": self.journeys_collection
-            }
-        })
+        base_status.update(self._status_template)
+        base_status["agent_metrics"] = asdict(self.agent_metrics)
         return base_status
 
 # Factory function for creating ADK ObserverAgent
@@ -493,13 +699,13 @@ async def main():
         
         # Test A2A messaging
         test_message = A2AMessage(
-            message_id=str(uuid.uuid4()),
+            message_id=uuid.uuid4().hex,
             sender="test-client",
             receiver="observer-agent",
             message_type=MessageType.REQUEST,
             action="health_check",
             payload={"test": True},
-            correlation_id=str(uuid.uuid4()),
+            correlation_id=uuid.uuid4().hex,
             timestamp=datetime.now(timezone.utc).isoformat()
         )
         
@@ -509,7 +715,8 @@ async def main():
         # Keep agent running
         logger.info("ADK ObserverAgent is running. Press Ctrl+C to stop.")
         while True:
-            await asyncio.sleep(10)
+            # Align ticks to the 10s boundary so the loop does not drift
+            await asyncio.sleep(10 - (time.monotonic() % 10))
             status = agent.get_agent_status()
             logger.info(f"Agent status: {status['status']}, Messages: {status['metrics']['messages_received']}")
             
@@ -7,11 +7,19 @@ This agent uses Google ADK with A2A protocol and is optimized for GCP deployment
 """
 
 import os
-import json
-import uuid
+import re
+import time
 import asyncio
+import hashlib
+import signal
 import logging
-from datetime import datetime, timezone
+import secrets
+import itertools
+from string import Template
+import orjson
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional
 
 import vertexai
@@ -26,9 +34,20 @@ from adk_base import (
     PravaahAgent, 
     AgentCapability, 
     A2AMessage, 
-    MessageType
+    MessageType,
+    _get_async_firestore_client,
+    _now_iso
 )
 
+# uvloop swaps the pure-Python selector loop for libuv; every await in
+# the long-lived orchestration loop gets cheaper. Optional - the stdlib
+# loop is a fine fallback where uvloop is not installed.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 # Configure logging for GCP
 logging.basicConfig(
     level=logging.INFO,
@@ -36,6 +55,70 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fallback extractor for strategy JSON embedded in prose responses
+_JSON_RE = re.compile(r'\{.*\}', re.DOTALL)
+
+# Persistent half of the strategy prompt; served from the Vertex AI
+# context cache so only the per-cycle situation block is billed in full
+_PRAVAAH_SYSTEM_PROMPT = """
+You are the strategic decision-making AI for Project Pravaah, an Urban Mobility Operating System for Bengaluru traffic management.
+
+Available Strategies:
+1. MONITOR_AND_WAIT - Continue monitoring, no intervention
+2. REROUTE_VEHICLES - Suggest alternate routes to vehicles
+3. EMERGENCY_INTERVENTION - Immediate traffic control measures
+4. COORDINATE_WITH_AUTHORITIES - Alert traffic police/authorities
+
+Respond with exactly this JSON format:
+{
+  "recommended_strategy": "[ONE_OF_THE_FOUR_STRATEGIES]",
+  "confidence": [0.0-1.0],
+  "reasoning": "[Brief explanation]"
+}
+"""
+
+@dataclass(slots=True)
+class _AgentMetrics:
+    """Slotted metrics holder - counter bumps are attribute stores, not
+    dict hashes, and slots cut the per-instance memory."""
+    orchestration_cycles: int = 0
+    interventions_planned: int = 0
+    gemini_calls: int = 0
+    gemini_failures: int = 0
+    gemini_cache_hits: int = 0
+    gemini_cache_misses: int = 0
+    speculation_hits: int = 0
+    speculation_misses: int = 0
+    decisions_made: int = 0
+    errors: int = 0
+    last_orchestration: Optional[str] = None
+
+
+# Vertex AI init and model wrappers are process-wide; repeat agents in
+# the same worker reuse them instead of re-initializing
+_VERTEX_INITIALIZED = set()
+_GEMINI_MODELS: Dict[str, GenerativeModel] = {}
+
+# Strategy -> intervention lookup, built once
+_STRATEGY_MAPPING = {
+    "MONITOR_AND_WAIT": "MONITOR",
+    "REROUTE_VEHICLES": "REROUTE",
+    "EMERGENCY_INTERVENTION": "EMERGENCY",
+    "COORDINATE_WITH_AUTHORITIES": "COORDINATE"
+}
+
+# Ephemeral half of the prompt; substituted once per call with only the
+# variable situation fields
+_SITUATION_TMPL = Template("""
+Current Situation:
+- Congestion Score: $cs/100
+- Critical Choke Point: $choke
+- Affected Vehicles: $vehicles
+- Prediction Confidence: $confidence
+- Peak Hour: $peak
+- Day: $dow
+""")
+
 class ADKOrchestratorAgent(PravaahAgent):
     """
     ADK-Enhanced Orchestrator Agent for Project Pravaah
@@ -47,6 +130,35 @@ class ADKOrchestratorAgent(PravaahAgent):
     - GCP-optimized for Cloud Run deployment
     """
     
+    # Gemini decisions for identical discretized situations are reused
+    # for this many seconds before a fresh call is made
+    DECISION_CACHE_TTL = 300
+    DECISION_CACHE_MAX = 128
+
+    # Vertex AI context cache lifetime; the refresh loop recreates it
+    # comfortably before expiry
+    CONTEXT_CACHE_TTL_MINUTES = 60
+    CONTEXT_CACHE_REFRESH_SECONDS = 50 * 60
+
+    # Micro-batching of concurrent Gemini calls: the consumer drains up
+    # to this many queued prompts arriving within the wait window and
+    # ships them as one concurrent burst
+    GEMINI_BATCH_MAX = 8
+    GEMINI_BATCH_WINDOW = 0.05
+
+    # Agent discovery results are reused for this many seconds; peers
+    # do not come and go between cycles
+    DISCOVERY_CACHE_TTL = 30
+
+    __slots__ = (
+        "project_id", "location", "congestion_threshold",
+        "firestore_client", "gemini_model", "_cached_content",
+        "_cached_model", "agent_metrics", "_decision_cache",
+        "_gemini_queue", "_id_prefix", "_id_counter",
+        "_discovery_cache", "strategy_options", "_handlers",
+        "_cycle_sem", "_decision_sem", "_cycle_trigger", "_last_cycle_monotonic",
+    )
+
     def __init__(self, 
                  project_id: str = "stable-sign-454210-i0",
                  location: str = "asia-south1",
@@ -66,22 +178,43 @@ class ADKOrchestratorAgent(PravaahAgent):
         self.location = location
         self.congestion_threshold = congestion_threshold
         
-        # Initialize Google Cloud services
-        self.firestore_client = firestore.Client(project=project_id)
+        # Initialize Google Cloud services (shared async client: writes
+        # are awaitable and never stall the event loop)
+        self.firestore_client = _get_async_firestore_client(project_id)
         
         # Initialize Vertex AI for Gemini
         self._initialize_vertex_ai()
         
         # Agent-specific metrics
-        self.agent_metrics = {
-            "orchestration_cycles": 0,
-            "interventions_planned": 0,
-            "gemini_calls": 0,
-            "gemini_failures": 0,
-            "decisions_made": 0,
-            "last_orchestration": None
-        }
+        self.agent_metrics = _AgentMetrics()
         
+        # LRU of recent Gemini strategies keyed by discretized situation
+        # features; most cycles quantize to a handful of distinct states
+        self._decision_cache: OrderedDict = OrderedDict()
+
+        # Pending (prompt, future) pairs awaiting the Gemini micro-batcher
+        self._gemini_queue: asyncio.Queue = asyncio.Queue()
+
+        # Cheap correlation/message IDs: uuid4 reads urandom per call,
+        # so internal IDs use a random prefix plus a counter instead
+        self._id_prefix = secrets.token_hex(4)
+        self._id_counter = itertools.count()
+
+        # capability -> (monotonic ts, discovered agents)
+        self._discovery_cache: Dict[Any, Any] = {}
+
+        # At most one orchestration cycle in flight; overlapping
+        # triggers are skipped rather than queued
+        self._cycle_sem = asyncio.Semaphore(1)
+        # Bounds concurrent Gemini-backed decisions to the batch width
+        # so an A2A burst cannot pile up unbounded in-flight calls
+        self._decision_sem = asyncio.Semaphore(self.GEMINI_BATCH_MAX)
+
+        # Set by handlers wanting an immediate periodic cycle; the loop
+        # also wakes on its own every interval
+        self._cycle_trigger = asyncio.Event()
+        self._last_cycle_monotonic = 0.0
+
         # Strategic decision options
         self.strategy_options = [
             "MONITOR_AND_WAIT",
@@ -90,9 +223,31 @@ class ADKOrchestratorAgent(PravaahAgent):
             "COORDINATE_WITH_AUTHORITIES"
         ]
         
+        # O(1) action dispatch for on_message
+        self._handlers = {
+            "run_orchestration_cycle": self._handle_run_orchestration_cycle,
+            "make_strategic_decision": self._handle_make_strategic_decision,
+            "coordinate_agents": self._handle_coordinate_agents,
+            "plan_intervention": self._handle_plan_intervention,
+            "health_check": self._handle_health_check
+        }
+
         logger.info(f"ADK OrchestratorAgent initialized for project: {project_id}")
         logger.info(f"Gemini AI integration ready in region: {location}")
     
+    async def _discover_agents_cached(self, capability: AgentCapability):
+        """Discover agents for a capability, cached with a short TTL."""
+        cached = self._discovery_cache.get(capability)
+        if cached and time.monotonic() - cached[0] < self.DISCOVERY_CACHE_TTL:
+            return cached[1]
+        agents = await self.discover_agents(capability)
+        self._discovery_cache[capability] = (time.monotonic(), agents)
+        return agents
+    
+    def _new_id(self) -> str:
+        """Cheap internal ID: agent-id prefix plus a process-unique counter."""
+        return f"{self.agent_id}-{self._id_prefix}{next(self._id_counter):x}"
+    
     def _initialize_vertex_ai(self):
         """Initialize Vertex AI for GCP deployment."""
         try:
@@ -105,17 +260,48 @@ class ADKOrchestratorAgent(PravaahAgent):
                 # Cloud Run deployment with metadata service
                 logger.info("Using GCP metadata service for authentication")
             
-            # Initialize Vertex AI
-            vertexai.init(project=self.project_id, location=self.location)
-            
-            # Initialize Gemini model
-            self.gemini_model = GenerativeModel("gemini-1.5-pro")
+            # Initialize Vertex AI once per (project, location)
+            if (self.project_id, self.location) not in _VERTEX_INITIALIZED:
+                vertexai.init(project=self.project_id, location=self.location)
+                _VERTEX_INITIALIZED.add((self.project_id, self.location))
+            
+            # Shared Gemini model wrapper; JSON response mode means the
+            # reply parses directly without regex extraction
+            model = _GEMINI_MODELS.get("gemini-1.5-pro")
+            if model is None:
+                model = GenerativeModel(
+                    "gemini-1.5-pro",
+                    generation_config={"response_mime_type": "application/json"}
+                )
+                _GEMINI_MODELS["gemini-1.5-pro"] = model
+            self.gemini_model = model
+            
+            # Cache the persistent system prompt server-side: cached
+            # input tokens are heavily discounted and skip re-upload
+            self._create_context_cache()
             
             logger.info(f"Vertex AI initialized for project {self.project_id} in {self.location}")
             
         except Exception as e:
-            logger.error(f"Failed to initialize Vertex AI: {e}")
+            logger.error("Failed to initialize Vertex AI: %s", e)
             self.gemini_model = None
+            self._cached_model = None
+    
+    def _create_context_cache(self):
+        """(Re)create the Vertex AI context cache for the system prompt."""
+        try:
+            from vertexai.preview import caching
+            self._cached_content = caching.CachedContent.create(
+                model_name="gemini-1.5-pro",
+                system_instruction=_PRAVAAH_SYSTEM_PROMPT,
+                ttl=timedelta(minutes=self.CONTEXT_CACHE_TTL_MINUTES)
+            )
+            self._cached_model = GenerativeModel.from_cached_content(self._cached_content)
+            logger.info("Vertex AI context cache created for system prompt")
+        except Exception as e:
+            logger.warning("Context caching unavailable, sending full prompt per call: %s", e)
+            self._cached_content = None
+            self._cached_model = None
     
     async def on_start(self):
         """ADK lifecycle hook - called when agent starts."""
@@ -126,10 +312,16 @@ class ADKOrchestratorAgent(PravaahAgent):
             # Start orchestration loop
             asyncio.create_task(self._orchestration_loop())
             
+            # Keep the context cache warm past its TTL
+            asyncio.create_task(self._context_cache_refresh_loop())
+            
+            # Micro-batch concurrent Gemini prompts
+            asyncio.create_task(self._gemini_batch_loop())
+            
             logger.info("ADK OrchestratorAgent started successfully")
             
         except Exception as e:
-            logger.error(f"Failed to start ADK OrchestratorAgent: {e}")
+            logger.error("Failed to start ADK OrchestratorAgent: %s", e)
             raise
     
     async def on_stop(self):
@@ -139,7 +331,7 @@ class ADKOrchestratorAgent(PravaahAgent):
             # Cleanup resources if needed
             
         except Exception as e:
-            logger.error(f"Error stopping ADK OrchestratorAgent: {e}")
+            logger.error("Error stopping ADK OrchestratorAgent: %s", e)
     
     async def on_message(self, message: A2AMessage) -> Optional[Dict[str, Any]]:
         """Handle incoming A2A messages."""
@@ -149,32 +341,20 @@ class ADKOrchestratorAgent(PravaahAgent):
             
             logger.info(f"OrchestratorAgent processing A2A message: {action}")
             
-            if action == "run_orchestration_cycle":
-                return await self._handle_run_orchestration_cycle(payload)
-            
-            elif action == "make_strategic_decision":
-                return await self._handle_make_strategic_decision(payload)
-            
-            elif action == "coordinate_agents":
-                return await self._handle_coordinate_agents(payload)
-            
-            elif action == "plan_intervention":
-                return await self._handle_plan_intervention(payload)
-            
-            elif action == "health_check":
-                return await self._handle_health_check(payload)
-            
-            else:
+            handler = self._handlers.get(action)
+            if handler is None:
                 logger.warning(f"Unknown action: {action}")
                 return {
                     "success": False,
                     "error": f"Unknown action: {action}",
                     "agent_id": self.agent_id
                 }
+            
+            return await handler(payload)
                 
         except Exception as e:
-            logger.error(f"Error handling A2A message: {e}")
-            self.agent_metrics["errors"] += 1
+            logger.error("Error handling A2A message: %s", e)
+            self.agent_metrics.errors += 1
             return {
                 "success": False,
                 "error": str(e),
@@ -184,26 +364,30 @@ class ADKOrchestratorAgent(PravaahAgent):
     async def _handle_run_orchestration_cycle(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle orchestration cycle request via A2A."""
         try:
-            cycle_id = payload.get("cycle_id", str(uuid.uuid4()))
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            cycle_id = payload.get("cycle_id", self._new_id())
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Run complete orchestration cycle
             orchestration_result = await self.run_orchestration_cycle(cycle_id)
-            
-            self.agent_metrics["orchestration_cycles"] += 1
-            self.agent_metrics["last_orchestration"] = datetime.now(timezone.utc).isoformat()
+
+            self.agent_metrics.orchestration_cycles += 1
+            self.agent_metrics.last_orchestration = _now_iso()
+
+            # Wake the periodic loop: it sees the fresh cycle, skips, and
+            # re-anchors its full wait to this on-demand run
+            self._cycle_trigger.set()
             
             return {
                 "success": True,
                 "correlation_id": correlation_id,
                 "cycle_id": cycle_id,
                 "orchestration_result": orchestration_result,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
         except Exception as e:
-            logger.error(f"Error in orchestration cycle: {e}")
+            logger.error("Error in orchestration cycle: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -214,23 +398,25 @@ class ADKOrchestratorAgent(PravaahAgent):
         """Handle strategic decision request via A2A."""
         try:
             situation_data = payload.get("situation_data", {})
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
-            # Make strategic decision using Gemini AI
-            decision_result = await self._reason_and_decide(situation_data)
+            # Make strategic decision using Gemini AI, bounded so A2A
+            # bursts cannot spawn unlimited in-flight Gemini calls
+            async with self._decision_sem:
+                decision_result = await self._reason_and_decide(situation_data)
             
-            self.agent_metrics["decisions_made"] += 1
+            self.agent_metrics.decisions_made += 1
             
             return {
                 "success": True,
                 "correlation_id": correlation_id,
                 "decision_result": decision_result,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
         except Exception as e:
-            logger.error(f"Error making strategic decision: {e}")
+            logger.error("Error making strategic decision: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -241,7 +427,7 @@ class ADKOrchestratorAgent(PravaahAgent):
         """Handle agent coordination request via A2A."""
         try:
             coordination_plan = payload.get("coordination_plan", {})
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Coordinate with other agents
             coordination_result = await self._coordinate_multi_agent_action(coordination_plan)
@@ -250,12 +436,12 @@ class ADKOrchestratorAgent(PravaahAgent):
                 "success": True,
                 "correlation_id": correlation_id,
                 "coordination_result": coordination_result,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
         except Exception as e:
-            logger.error(f"Error coordinating agents: {e}")
+            logger.error("Error coordinating agents: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -267,24 +453,24 @@ class ADKOrchestratorAgent(PravaahAgent):
         try:
             intervention_type = payload.get("intervention_type", "REROUTE_VEHICLES")
             situation_data = payload.get("situation_data", {})
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", self._new_id())
             
             # Plan intervention
             intervention_plan = await self._plan_intervention(intervention_type, situation_data)
             
-            self.agent_metrics["interventions_planned"] += 1
+            self.agent_metrics.interventions_planned += 1
             
             return {
                 "success": True,
                 "correlation_id": correlation_id,
                 "intervention_plan": intervention_plan,
                 "intervention_type": intervention_type,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
         except Exception as e:
-            logger.error(f"Error planning intervention: {e}")
+            logger.error("Error planning intervention: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -298,11 +484,11 @@ class ADKOrchestratorAgent(PravaahAgent):
         return {
             "success": True,
             "status": "healthy",
-            "metrics": self.agent_metrics,
+            "metrics": asdict(self.agent_metrics),
             "gemini_status": gemini_status,
             "strategy_options": self.strategy_options,
-            "capabilities": [cap.value for cap in self.capabilities],
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "capabilities": [cap.label for cap in self.capabilities],
+            "timestamp": _now_iso(),
             "agent_id": self.agent_id
         }
     
@@ -315,51 +501,76 @@ class ADKOrchestratorAgent(PravaahAgent):
             if not cycle_id:
                 cycle_id = f"cycle_{datetime.now(timezone.utc).strftime('%Y%m%d_%H%M%S')}"
             
-            start_time = datetime.now(timezone.utc)
-            logger.info(f"Starting orchestration cycle [{cycle_id}]")
-            
-            # Step 1: Get network state from ObserverAgent via A2A
-            perception_data = await self._request_perception_data()
+            # A slow Gemini path can outlast the trigger interval; never
+            # stack a second cycle on top of a running one
+            if self._cycle_sem.locked():
+                logger.warning(f"Skipping overlapping orchestration cycle [{cycle_id}]")
+                return {"cycle_id": cycle_id, "status": "skipped_overlap"}
             
-            # Step 2: Get predictions from SimulationAgent via A2A
-            prediction_data = await self._request_prediction_data(perception_data)
-            
-            # Step 3: Make strategic decision using Gemini AI
-            decision_result = await self._reason_and_decide(prediction_data)
-            
-            # Step 4: Execute decision via CommunicationsAgent if needed
-            execution_result = None
-            if decision_result.get("intervention_needed", False):
-                execution_result = await self._execute_intervention(decision_result)
-            
-            end_time = datetime.now(timezone.utc)
-            duration = (end_time - start_time).total_seconds()
-            
-            orchestration_result = {
-                "cycle_id": cycle_id,
-                "perception_data": perception_data,
-                "prediction_data": prediction_data,
-                "decision_result": decision_result,
-                "execution_result": execution_result,
-                "duration_seconds": duration,
-                "timestamp": end_time.isoformat(),
-                "status": "completed"
-            }
-            
-            logger.info(f"Orchestration cycle [{cycle_id}] completed in {duration:.2f}s")
-            
-            return orchestration_result
+            async with self._cycle_sem:
+                return await self._run_orchestration_cycle_locked(cycle_id)
             
         except Exception as e:
-            logger.error(f"Error in orchestration cycle [{cycle_id}]: {e}")
-            self.agent_metrics["errors"] += 1
+            logger.error("Error in orchestration cycle [%s]: %s", cycle_id, e)
+            self.agent_metrics.errors += 1
             raise
     
+    async def _run_orchestration_cycle_locked(self, cycle_id: str) -> Dict[str, Any]:
+        """Cycle body; runs with the cycle semaphore held."""
+        start = time.perf_counter()
+        logger.info(f"Starting orchestration cycle [{cycle_id}]")
+        
+        # Warm both upstream discoveries concurrently so the serial
+        # perception -> prediction chain hits a populated cache
+        await asyncio.gather(
+            self._discover_agents_cached(AgentCapability.PERCEPTION),
+            self._discover_agents_cached(AgentCapability.PREDICTION)
+        )
+        
+        # Step 1: Get network state from ObserverAgent via A2A
+        perception_data = await self._request_perception_data()
+        
+        # Step 2: Get predictions from SimulationAgent via A2A
+        prediction_data = await self._request_prediction_data(perception_data)
+        
+        # Prefetch communications discovery while Gemini reasons, so
+        # intervention execution finds a completed lookup
+        comm_prefetch = asyncio.create_task(
+            self._discover_agents_cached(AgentCapability.COMMUNICATION)
+        )
+        
+        # Step 3: Make strategic decision using Gemini AI
+        decision_result = await self._reason_and_decide(prediction_data)
+        
+        # Step 4: Execute decision via CommunicationsAgent if needed
+        execution_result = None
+        if decision_result.get("intervention_needed", False):
+            execution_result = await self._execute_intervention(decision_result)
+        
+        duration = time.perf_counter() - start
+        
+        orchestration_result = {
+            "cycle_id": cycle_id,
+            "perception_data": perception_data,
+            "prediction_data": prediction_data,
+            "decision_result": decision_result,
+            "execution_result": execution_result,
+            "duration_seconds": duration,
+            "timestamp": _now_iso(),
+            "status": "completed"
+        }
+        
+        comm_prefetch.cancel()
+        self._last_cycle_monotonic = time.monotonic()
+        logger.info(f"Orchestration cycle [{cycle_id}] completed in {duration:.2f}s")
+        
+        return orchestration_result
+    
     async def _request_perception_data(self) -> Dict[str, Any]:
         """Request perception data from ObserverAgent via A2A."""
         try:
             # Discover ObserverAgent
-            observer_agents = await self.discover_agents(AgentCapability.PERCEPTION)
+            observer_agents = await self._discover_agents_cached(AgentCapability.PERCEPTION)
             
             if not observer_agents:
                 logger.warning("No ObserverAgent found, using fallback")
@@ -367,14 +578,14 @@ class ADKOrchestratorAgent(PravaahAgent):
             
             # Send A2A message to ObserverAgent
             perception_message = A2AMessage(
-                message_id=str(uuid.uuid4()),
+                message_id=self._new_id(),
                 sender=self.agent_id,
                 receiver="observer-agent",
                 message_type=MessageType.REQUEST,
                 action="get_network_state",
-                payload={"correlation_id": str(uuid.uuid4())},
-                correlation_id=str(uuid.uuid4()),
-                timestamp=datetime.now(timezone.utc).isoformat()
+                payload={"correlation_id": self._new_id()},
+                correlation_id=self._new_id(),
+                timestamp=_now_iso()
             )
             
             # For now, simulate the response (in full implementation, this would use actual A2A messaging)
@@ -383,7 +594,7 @@ class ADKOrchestratorAgent(PravaahAgent):
                     "active_vehicles": 150,
                     "average_speed": 35.5,
                     "congestion_level": "medium",
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _now_iso()
                 },
                 "source": "observer_agent_a2a"
             }
@@ -392,14 +603,14 @@ class ADKOrchestratorAgent(PravaahAgent):
             return perception_data
             
         except Exception as e:
-            logger.error(f"Error requesting perception data: {e}")
+            logger.error("Error requesting perception data: %s", e)
             return {"error": str(e)}
     
     async def _request_prediction_data(self, perception_data: Dict[str, Any]) -> Dict[str, Any]:
         """Request prediction data from SimulationAgent via A2A."""
         try:
             # Discover SimulationAgent
-            simulation_agents = await self.discover_agents(AgentCapability.PREDICTION)
+            simulation_agents = await self._discover_agents_cached(AgentCapability.PREDICTION)
             
             if not simulation_agents:
                 logger.warning("No SimulationAgent found, using fallback")
@@ -407,7 +618,7 @@ class ADKOrchestratorAgent(PravaahAgent):
             
             # Send A2A message to SimulationAgent
             prediction_message = A2AMessage(
-                message_id=str(uuid.uuid4()),
+                message_id=self._new_id(),
                 sender=self.agent_id,
                 receiver="simulation-agent",
                 message_type=MessageType.REQUEST,
@@ -415,10 +626,10 @@ class ADKOrchestratorAgent(PravaahAgent):
                 payload={
                     "network_state": perception_data.get("network_state", {}),
                     "time_horizon_minutes": 30,
-                    "correlation_id": str(uuid.uuid4())
+                    "correlation_id": self._new_id()
                 },
-                correlation_id=str(uuid.uuid4()),
-                timestamp=datetime.now(timezone.utc).isoformat()
+                correlation_id=self._new_id(),
+                timestamp=_now_iso()
             )
             
             # For now, simulate the response (in full implementation, this would use actual A2A messaging)
@@ -435,7 +646,7 @@ class ADKOrchestratorAgent(PravaahAgent):
             return prediction_data
             
         except Exception as e:
-            logger.error(f"Error requesting prediction data: {e}")
+            logger.error("Error requesting prediction data: %s", e)
             return {"error": str(e)}
     
     async def _reason_and_decide(self, prediction_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -450,7 +661,7 @@ class ADKOrchestratorAgent(PravaahAgent):
                     "prediction_confidence": prediction_data.get("prediction_confidence", 0.5)
                 },
                 "temporal_context": {
-                    "current_time": datetime.now(timezone.utc).isoformat(),
+                    "current_time": _now_iso(),
                     "is_peak_hour": self._is_peak_hour(),
                     "day_of_week": datetime.now().strftime("%A")
                 },
@@ -464,6 +675,15 @@ class ADKOrchestratorAgent(PravaahAgent):
                 }
             }
             
+            # Speculate: the rule-based strategy predicts Gemini's answer
+            # for most cycles, so plan its intervention while Gemini is
+            # in flight and commit the plan only on a match
+            predicted_strategy = self._fallback_strategy_decision(prediction_data)
+            spec_task = asyncio.create_task(self._plan_intervention(
+                self._map_strategy_to_intervention(predicted_strategy),
+                prediction_data
+            ))
+            
             # Try Gemini AI decision
             gemini_strategy = await self._get_gemini_strategy(situation_report)
             
@@ -471,26 +691,35 @@ class ADKOrchestratorAgent(PravaahAgent):
                 # Use Gemini recommendation
                 strategy = gemini_strategy
                 reasoning_source = "gemini_ai"
-                self.agent_metrics["gemini_calls"] += 1
+                self.agent_metrics.gemini_calls += 1
             else:
-                # Fallback to rule-based decision
-                strategy = self._fallback_strategy_decision(prediction_data)
+                # Fall back to the rule-based prediction computed above
+                strategy = predicted_strategy
                 reasoning_source = "fallback_rules"
-                self.agent_metrics["gemini_failures"] += 1
+                self.agent_metrics.gemini_failures += 1
             
             # Map strategy to intervention
             intervention_type = self._map_strategy_to_intervention(strategy)
             intervention_needed = intervention_type != "MONITOR"
             
+            if strategy == predicted_strategy:
+                self.agent_metrics.speculation_hits += 1
+                intervention_plan = await spec_task
+            else:
+                self.agent_metrics.speculation_misses += 1
+                spec_task.cancel()
+                intervention_plan = await self._plan_intervention(intervention_type, prediction_data)
+            
             decision_result = {
                 "strategy": strategy,
                 "intervention_type": intervention_type,
                 "intervention_needed": intervention_needed,
+                "intervention_plan": intervention_plan,
                 "reasoning_source": reasoning_source,
                 "risk_level": self._calculate_risk_level(prediction_data),
                 "confidence": prediction_data.get("prediction_confidence", 0.5),
                 "situation_report": situation_report,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             }
             
             logger.info(f"Strategic decision: {strategy} -> {intervention_type} (source: {reasoning_source})")
@@ -498,7 +727,7 @@ class ADKOrchestratorAgent(PravaahAgent):
             return decision_result
             
         except Exception as e:
-            logger.error(f"Error in strategic decision making: {e}")
+            logger.error("Error in strategic decision making: %s", e)
             return {
                 "strategy": "MONITOR_AND_WAIT",
                 "intervention_needed": False,
@@ -506,6 +735,22 @@ class ADKOrchestratorAgent(PravaahAgent):
                 "reasoning_source": "error_fallback"
             }
     
+    def _situation_cache_key(self, situation_report: Dict[str, Any]) -> str:
+        """Hash the decision-relevant, discretized situation features.
+
+        Raw congestion scores are bucketed to tens so near-identical
+        situations share a cache entry.
+        """
+        traffic = situation_report.get("traffic_analysis", {})
+        temporal = situation_report.get("temporal_context", {})
+        features = {
+            "bucket": int(traffic.get("congestion_score", 0) // 10),
+            "choke": traffic.get("critical_choke_point"),
+            "peak": temporal.get("is_peak_hour"),
+            "dow": temporal.get("day_of_week")
+        }
+        return hashlib.sha256(orjson.dumps(features, option=orjson.OPT_SORT_KEYS)).hexdigest()
+
     async def _get_gemini_strategy(self, situation_report: Dict[str, Any]) -> Optional[str]:
         """Get strategic recommendation from Gemini AI (GCP-optimized)."""
         try:
@@ -513,53 +758,65 @@ class ADKOrchestratorAgent(PravaahAgent):
                 logger.warning("Gemini model not available")
                 return None
             
-            prompt = f"""
-You are the strategic decision-making AI for Project Pravaah, an Urban Mobility Operating System for Bengaluru traffic management.
-
-Current Situation:
-- Congestion Score: {situation_report['traffic_analysis']['congestion_score']}/100
-- Critical Choke Point: {situation_report['traffic_analysis']['critical_choke_point']}
-- Affected Vehicles: {situation_report['traffic_analysis']['affected_vehicles']}
-- Prediction Confidence: {situation_report['traffic_analysis']['prediction_confidence']}
-- Peak Hour: {situation_report['temporal_context']['is_peak_hour']}
-- Day: {situation_report['temporal_context']['day_of_week']}
-
-Available Strategies:
-1. MONITOR_AND_WAIT - Continue monitoring, no intervention
-2. REROUTE_VEHICLES - Suggest alternate routes to vehicles
-3. EMERGENCY_INTERVENTION - Immediate traffic control measures
-4. COORDINATE_WITH_AUTHORITIES - Alert traffic police/authorities
-
-Respond with exactly this JSON format:
-{{
-  "recommended_strategy": "[ONE_OF_THE_FOUR_STRATEGIES]",
-  "confidence": [0.0-1.0],
-  "reasoning": "[Brief explanation]"
-}}
-"""
+            # Serve repeat situations from the LRU cache: a hit replaces
+            # a multi-second Gemini round-trip with a dict lookup
+            cache_key = self._situation_cache_key(situation_report)
+            cached = self._decision_cache.get(cache_key)
+            if cached and time.monotonic() - cached[0] < self.DECISION_CACHE_TTL:
+                self._decision_cache.move_to_end(cache_key)
+                self.agent_metrics.gemini_cache_hits += 1
+                return cached[1]
+            self.agent_metrics.gemini_cache_misses += 1
+            
+            # Only the variable situation block ships per call; the
+            # persona and response contract live in the context cache
+            traffic = situation_report["traffic_analysis"]
+            temporal = situation_report["temporal_context"]
+            situation_block = _SITUATION_TMPL.substitute(
+                cs=traffic["congestion_score"],
+                choke=traffic["critical_choke_point"],
+                vehicles=traffic["affected_vehicles"],
+                confidence=traffic["prediction_confidence"],
+                peak=temporal["is_peak_hour"],
+                dow=temporal["day_of_week"]
+            )
             
-            response = self.gemini_model.generate_content(prompt)
+            # Hand the prompt to the micro-batcher so bursts of
+            # concurrent decisions share one network round
+            future = asyncio.get_running_loop().create_future()
+            await self._gemini_queue.put((situation_block, future))
+            response = await future
             
             if response and response.text:
-                # Parse JSON response
-                import re
-                json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
-                if json_match:
-                    strategy_data = json.loads(json_match.group())
+                # JSON response mode returns pure JSON; fall back to the
+                # precompiled extractor if prose sneaks in anyway
+                try:
+                    strategy_data = orjson.loads(response.text)
+                except orjson.JSONDecodeError:
+                    json_match = _JSON_RE.search(response.text)
+                    strategy_data = orjson.loads(json_match.group()) if json_match else None
+                
+                if strategy_data:
                     recommended_strategy = strategy_data.get("recommended_strategy")
                     
                     if recommended_strategy in self.strategy_options:
                         logger.info(f"Gemini recommended: {recommended_strategy}")
+                        self._decision_cache[cache_key] = (time.monotonic(), recommended_strategy)
+                        if len(self._decision_cache) > self.DECISION_CACHE_MAX:
+                            self._decision_cache.popitem(last=False)
                         return recommended_strategy
             
             logger.warning("Invalid Gemini response format")
             return None
             
         except GoogleAPICallError as e:
-            logger.error(f"Gemini API error: {e}")
+            logger.error("Gemini API error: %s", e)
+            return None
+        except (asyncio.TimeoutError, orjson.JSONDecodeError) as e:
+            logger.error("Gemini response error: %s", e)
             return None
         except Exception as e:
-            logger.error(f"Error calling Gemini: {e}")
+            logger.error("Error calling Gemini: %s", e)
             return None
     
     def _fallback_strategy_decision(self, prediction_data: Dict[str, Any]) -> str:
@@ -580,18 +837,12 @@ Respond with exactly this JSON format:
             return strategy
             
         except Exception as e:
-            logger.error(f"Error in fallback decision: {e}")
+            logger.error("Error in fallback decision: %s", e)
             return "MONITOR_AND_WAIT"
     
     def _map_strategy_to_intervention(self, strategy: str) -> str:
         """Map strategy to intervention type."""
-        strategy_mapping = {
-            "MONITOR_AND_WAIT": "MONITOR",
-            "REROUTE_VEHICLES": "REROUTE",
-            "EMERGENCY_INTERVENTION": "EMERGENCY",
-            "COORDINATE_WITH_AUTHORITIES": "COORDINATE"
-        }
-        return strategy_mapping.get(strategy, "MONITOR")
+        return _STRATEGY_MAPPING.get(strategy, "MONITOR")
     
     def _calculate_risk_level(self, prediction_data: Dict[str, Any]) -> str:
         """Calculate risk level based on prediction data."""
@@ -613,7 +864,8 @@ Respond with exactly this JSON format:
     def _is_peak_hour(self) -> bool:
         """Check if current time is peak hour in Bengaluru."""
         try:
-            current_hour = datetime.now().hour
+            # localtime avoids a datetime allocation on this hot helper
+            current_hour = time.localtime().tm_hour
             return (8 <= current_hour <= 11) or (17 <= current_hour <= 21)
         except Exception:
             return False
@@ -627,7 +879,7 @@ Respond with exactly this JSON format:
                 return {"action": "no_intervention_needed"}
             
             # Discover CommunicationsAgent
-            comm_agents = await self.discover_agents(AgentCapability.COMMUNICATION)
+            comm_agents = await self._discover_agents_cached(AgentCapability.COMMUNICATION)
             
             if not comm_agents:
                 logger.warning("No CommunicationsAgent found")
@@ -635,7 +887,7 @@ Respond with exactly this JSON format:
             
             # Send A2A message to CommunicationsAgent
             execution_message = A2AMessage(
-                message_id=str(uuid.uuid4()),
+                message_id=self._new_id(),
                 sender=self.agent_id,
                 receiver="communications-agent",
                 message_type=MessageType.REQUEST,
@@ -643,10 +895,10 @@ Respond with exactly this JSON format:
                 payload={
                     "intervention_type": intervention_type,
                     "decision_result": decision_result,
-                    "correlation_id": str(uuid.uuid4())
+                    "correlation_id": self._new_id()
                 },
-                correlation_id=str(uuid.uuid4()),
-                timestamp=datetime.now(timezone.utc).isoformat()
+                correlation_id=self._new_id(),
+                timestamp=_now_iso()
             )
             
             # For now, simulate the response
@@ -661,7 +913,7 @@ Respond with exactly this JSON format:
             return execution_result
             
         except Exception as e:
-            logger.error(f"Error executing intervention: {e}")
+            logger.error("Error executing intervention: %s", e)
             return {"error": str(e)}
     
     async def _coordinate_multi_agent_action(self, coordination_plan: Dict[str, Any]) -> Dict[str, Any]:
@@ -674,13 +926,13 @@ Respond with exactly this JSON format:
             coordination_results = {
                 "agents_coordinated": ["observer-agent", "simulation-agent", "communications-agent"],
                 "coordination_success": True,
-                "timestamp": datetime.now(timezone.utc).isoformat()
+                "timestamp": _now_iso()
             }
             
             return coordination_results
             
         except Exception as e:
-            logger.error(f"Error coordinating agents: {e}")
+            logger.error("Error coordinating agents: %s", e)
             return {"error": str(e)}
     
     async def _plan_intervention(self, intervention_type: str, situation_data: Dict[str, Any]) -> Dict[str, Any]:
@@ -707,19 +959,19 @@ Respond with exactly this JSON format:
             plan = intervention_plans.get(intervention_type, {"action": "monitor"})
             plan["intervention_type"] = intervention_type
             plan["situation_data"] = situation_data
-            plan["timestamp"] = datetime.now(timezone.utc).isoformat()
+            plan["timestamp"] = _now_iso()
             
             return plan
             
         except Exception as e:
-            logger.error(f"Error planning intervention: {e}")
+            logger.error("Error planning intervention: %s", e)
             return {"error": str(e)}
     
     async def _test_gemini_connectivity(self):
         """Test Gemini connectivity for GCP deployment."""
         try:
             if self.gemini_model:
-                test_response = self.gemini_model.generate_content("Test connectivity")
+                test_response = await self.gemini_model.generate_content_async("Test connectivity")
                 if test_response:
                     logger.info("Gemini connectivity test successful")
                 else:
@@ -728,7 +980,59 @@ Respond with exactly this JSON format:
                 logger.warning("Gemini model not initialized")
                 
         except Exception as e:
-            logger.warning(f"Gemini connectivity test error: {e}")
+            logger.warning("Gemini connectivity test error: %s", e)
+    
+    async def _generate_strategy_content(self, situation_block: str):
+        """Issue one Gemini call, preferring the cached-context model."""
+        if self._cached_model:
+            return await self._cached_model.generate_content_async(situation_block)
+        return await self.gemini_model.generate_content_async(_PRAVAAH_SYSTEM_PROMPT + situation_block)
+    
+    async def _gemini_batch_loop(self):
+        """Drain queued prompts in small windows and fan them out together.
+
+        Runs for the life of the process; callers block on per-prompt
+        futures, so the loop must never exit while prompts can arrive.
+        """
+        loop = asyncio.get_running_loop()
+        while True:
+            try:
+                batch = [await self._gemini_queue.get()]
+                deadline = loop.time() + self.GEMINI_BATCH_WINDOW
+                while len(batch) < self.GEMINI_BATCH_MAX:
+                    remaining = deadline - loop.time()
+                    if remaining <= 0:
+                        break
+                    try:
+                        batch.append(await asyncio.wait_for(self._gemini_queue.get(), remaining))
+                    except asyncio.TimeoutError:
+                        break
+                
+                responses = await asyncio.gather(
+                    *(self._generate_strategy_content(prompt) for prompt, _ in batch),
+                    return_exceptions=True
+                )
+                for (_, future), response in zip(batch, responses):
+                    if future.done():
+                        continue
+                    if isinstance(response, Exception):
+                        future.set_exception(response)
+                    else:
+                        future.set_result(response)
+                
+            except Exception as e:
+                logger.error("Error in Gemini batch loop: %s", e)
+    
+    async def _context_cache_refresh_loop(self):
+        """Recreate the Vertex AI context cache before its TTL lapses."""
+        try:
+            while self.status == "active":
+                await asyncio.sleep(self.CONTEXT_CACHE_REFRESH_SECONDS)
+                if self._cached_model:
+                    self._create_context_cache()
+            
+        except Exception as e:
+            logger.error("Context cache refresh loop failed: %s", e)
     
     async def _orchestration_loop(self):
         """Background orchestration loop for GCP deployment."""
@@ -737,27 +1041,30 @@ Respond with exactly this JSON format:
             
             while self.status == "active":
                 try:
-                    # Run periodic orchestration cycles
-                    await asyncio.sleep(300)  # Every 5 minutes
+                    # Wake on an explicit trigger or the periodic tick,
+                    # whichever comes first
+                    try:
+                        await asyncio.wait_for(self._cycle_trigger.wait(), timeout=300)
+                    except asyncio.TimeoutError:
+                        pass
+                    finally:
+                        self._cycle_trigger.clear()
                     
-                    # Only run if no recent orchestration
-                    if self.agent_metrics.get("last_orchestration"):
-                        last_time = datetime.fromisoformat(self.agent_metrics["last_orchestration"].replace('Z', '+00:00'))
-                        time_diff = (datetime.now(timezone.utc) - last_time).total_seconds()
-                        
-                        if time_diff < 240:  # Skip if less than 4 minutes ago
-                            continue
+                    # Skip if a cycle ran recently (monotonic compare,
+                    # no ISO parsing)
+                    if time.monotonic() - self._last_cycle_monotonic < 240:
+                        continue
                     
                     # Run orchestration cycle
                     cycle_result = await self.run_orchestration_cycle()
                     logger.info(f"Periodic orchestration completed: {cycle_result.get('status', 'unknown')}")
                     
                 except Exception as e:
-                    logger.error(f"Error in orchestration loop: {e}")
+                    logger.error("Error in orchestration loop: %s", e)
                     await asyncio.sleep(600)  # Wait longer on error
             
         except Exception as e:
-            logger.error(f"Orchestration loop failed: {e}")
+            logger.error("Orchestration loop failed: %s", e)
 
 # Factory function for creating ADK OrchestratorAgent
 async def create_adk_orchestrator_agent(project_id: str = "stable-sign-454210-i0") -> ADKOrchestratorAgent:
@@ -766,6 +1073,14 @@ async def create_adk_orchestrator_agent(project_id: str = "stable-sign-454210-i0
     await agent.start()
     return agent
 
+async def _heartbeat(agent: ADKOrchestratorAgent, stop: asyncio.Event):
+    """Log a status line every minute until shutdown is signalled."""
+    while not stop.is_set():
+        try:
+            await asyncio.wait_for(stop.wait(), timeout=60)
+        except asyncio.TimeoutError:
+            logger.info(f"Agent status: {agent.status}, Cycles: {agent.agent_metrics.orchestration_cycles}")
+
 # Main function for GCP Cloud Run deployment
 async def main():
     """Main function for GCP Cloud Run deployment."""
@@ -775,15 +1090,26 @@ async def main():
         # Create and start agent
         agent = await create_adk_orchestrator_agent()
         
-        # Keep agent running for Cloud Run
+        # Park the main coroutine on a shutdown event instead of a
+        # wakeup-per-minute poll; SIGTERM/SIGINT set it
+        stop = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            try:
+                loop.add_signal_handler(sig, stop.set)
+            except NotImplementedError:
+                pass
+        
+        asyncio.create_task(_heartbeat(agent, stop))
+        
         logger.info("ADK OrchestratorAgent is running on GCP")
-        while True:
-            await asyncio.sleep(60)
-            status = agent.get_status()
-            logger.info(f"Agent status: {status['status']}, Cycles: {status['metrics']['orchestration_cycles']}")
+        await stop.wait()
+        
+        logger.info("Shutdown signal received, stopping agent")
+        await agent.stop()
             
     except Exception as e:
-        logger.error(f"Error in ADK OrchestratorAgent: {e}")
+        logger.error("Error in ADK OrchestratorAgent: %s", e)
         raise
 
 if __name__ == "__main__":
@@ -8,6 +8,7 @@ This agent uses Google ADK with A2A protocol for standardized multi-agent coordi
 
 import os
 import json
+import bisect
 import uuid
 import asyncio
 import logging
@@ -23,13 +24,35 @@ from adk_base import (
     PravaahAgent, 
     AgentCapability, 
     A2AMessage, 
-    MessageType
+    MessageType,
+    _now_iso
 )
 
+# uvloop swaps the pure-Python selector loop for libuv; every await in
+# the prediction loop and A2A handlers gets cheaper. Optional - the
+# stdlib loop is a fine fallback where uvloop is not installed.
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    uvloop = None
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Bengaluru metropolitan bounding box shared by journey validation
+_BLR_LAT_MIN, _BLR_LAT_MAX = 12.5, 13.5
+_BLR_LNG_MIN, _BLR_LNG_MAX = 77.0, 78.0
+
+# Congestion score bins and labels, kept sorted for bisect
+_STATUS_BINS = (20.0, 40.0, 60.0, 80.0)
+_STATUS_LABELS = ("minimal", "low", "medium", "high", "critical")
+
+# 5 km proximity threshold in squared degrees (~111 km per degree);
+# comparing squared distances avoids a sqrt per journey x choke point
+_NEAR_SQ = (5.0 / 111.0) ** 2
+
 class ADKSimulationAgent(PravaahAgent):
     """
     ADK-Enhanced Simulation Agent for Project Pravaah
@@ -83,6 +106,13 @@ class ADKSimulationAgent(PravaahAgent):
             }
         }
         
+        # Flat (id, lat, lng) tuples for the traffic-counting inner
+        # loop; built once since choke points are fixed at construction
+        self._cp_points = [
+            (cp_id, cp["coordinates"]["lat"], cp["coordinates"]["lng"])
+            for cp_id, cp in self.choke_points.items()
+        ]
+
         # Agent-specific metrics
         self.agent_metrics = {
             "predictions_made": 0,
@@ -140,7 +170,7 @@ class ADKSimulationAgent(PravaahAgent):
                 return await self._handle_get_choke_point_status(payload)
             
             elif action == "health_check":
-                return await self._handle_health_check(payload)
+                return self._handle_health_check(payload)
             
             else:
                 logger.warning(f"Unknown action: {action}")
@@ -163,7 +193,7 @@ class ADKSimulationAgent(PravaahAgent):
         """Handle gridlock prediction request via A2A."""
         try:
             journeys = payload.get("journeys", [])
-            correlation_id = payload.get("correlation_id", str(uuid.uuid4()))
+            correlation_id = payload.get("correlation_id", uuid.uuid4().hex)
             
             # Run gridlock prediction analysis
             gridlock_result = await self.run_gridlock_prediction(journeys)
@@ -178,7 +208,7 @@ class ADKSimulationAgent(PravaahAgent):
                 "correlation_id": correlation_id,
                 "gridlock_result": gridlock_result,
                 "journeys_count": len(journeys),
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -190,15 +220,15 @@ class ADKSimulationAgent(PravaahAgent):
                 "agent_id": self.agent_id
             }
     
-    async def _handle_health_check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    def _handle_health_check(self, payload: Dict[str, Any]) -> Dict[str, Any]:
         """Handle health check request via A2A."""
         return {
             "success": True,
             "status": "healthy",
             "metrics": self.agent_metrics,
             "choke_points_monitored": len(self.choke_points),
-            "capabilities": [cap.value for cap in self.capabilities],
-            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "capabilities": [cap.label for cap in self.capabilities],
+            "timestamp": _now_iso(),
             "agent_id": self.agent_id
         }
     
@@ -211,7 +241,7 @@ class ADKSimulationAgent(PravaahAgent):
             logger.info("Starting gridlock prediction analysis...")
             
             # Validate and filter journeys
-            valid_journeys = await self._validate_journeys(journeys)
+            valid_journeys = self._validate_journeys(journeys)
             logger.info(f"Validated {len(valid_journeys)} out of {len(journeys)} journeys")
             
             if not valid_journeys:
@@ -222,15 +252,17 @@ class ADKSimulationAgent(PravaahAgent):
                     "affected_vehicles": 0,
                     "prediction_confidence": 0.0,
                     "recommendations": ["No valid journey data available"],
-                    "timestamp": datetime.now(timezone.utc).isoformat()
+                    "timestamp": _now_iso()
                 }
             
-            # Analyze traffic load at each choke point
+            # Count traffic once for all choke points, then score each
+            vehicle_counts = self._count_choke_point_traffic(valid_journeys)
+            
             choke_point_analysis = {}
             total_congestion_score = 0
             
-            for cp_id, cp_info in self.choke_points.items():
-                analysis = await self._analyze_choke_point_load(cp_id, valid_journeys)
+            for cp_id in self.choke_points:
+                analysis = self._score_choke_point_load(cp_id, vehicle_counts[cp_id])
                 choke_point_analysis[cp_id] = analysis
                 total_congestion_score += analysis["congestion_score"]
             
@@ -250,13 +282,13 @@ class ADKSimulationAgent(PravaahAgent):
             )
             
             # Generate recommendations
-            recommendations = await self._generate_recommendations(
+            recommendations = self._generate_recommendations(
                 choke_point_analysis, 
                 avg_congestion_score
             )
             
             # Calculate prediction confidence
-            confidence = await self._calculate_prediction_confidence(
+            confidence = self._calculate_prediction_confidence(
                 valid_journeys, 
                 choke_point_analysis
             )
@@ -273,7 +305,7 @@ class ADKSimulationAgent(PravaahAgent):
                 "prediction_confidence": round(confidence, 2),
                 "choke_point_analysis": choke_point_analysis,
                 "recommendations": recommendations,
-                "timestamp": datetime.now(timezone.utc).isoformat(),
+                "timestamp": _now_iso(),
                 "agent_id": self.agent_id
             }
             
@@ -286,83 +318,71 @@ class ADKSimulationAgent(PravaahAgent):
             self.agent_metrics["errors"] += 1
             raise
     
-    async def _validate_journeys(self, journeys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Validate journey data for prediction analysis."""
+    def _validate_journeys(self, journeys: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Validate journey data for prediction analysis.
+
+        One tight pass with the Bengaluru bounds inlined as chained
+        comparisons; malformed rows fall through the narrow except
+        instead of paying per-field checks. No awaits, so it is a
+        plain function.
+        """
         valid_journeys = []
+        append = valid_journeys.append
         
         for journey in journeys:
             try:
-                # Check required fields
-                if not all(key in journey for key in ["origin", "destination", "route"]):
+                if "route" not in journey:
                     continue
-                
-                # Validate coordinates
                 origin = journey["origin"]
                 destination = journey["destination"]
                 
-                if not self._validate_coordinates(origin) or not self._validate_coordinates(destination):
-                    continue
-                
-                # Check if journey passes through Bengaluru area
-                if not self._is_bengaluru_journey(origin, destination):
-                    continue
-                
-                valid_journeys.append(journey)
+                if (_BLR_LAT_MIN <= float(origin["lat"]) <= _BLR_LAT_MAX
+                        and _BLR_LNG_MIN <= float(origin["lng"]) <= _BLR_LNG_MAX
+                        and _BLR_LAT_MIN <= float(destination["lat"]) <= _BLR_LAT_MAX
+                        and _BLR_LNG_MIN <= float(destination["lng"]) <= _BLR_LNG_MAX):
+                    append(journey)
                 
-            except Exception as e:
-                logger.warning(f"Invalid journey data: {e}")
+            except (KeyError, TypeError, ValueError):
                 continue
         
         return valid_journeys
     
-    def _validate_coordinates(self, coords: Dict[str, Any]) -> bool:
-        """Validate coordinate data."""
-        try:
-            lat = float(coords.get("lat", 0))
-            lng = float(coords.get("lng", 0))
-            
-            # Basic coordinate validation for Bengaluru area
-            return (12.5 <= lat <= 13.5) and (77.0 <= lng <= 78.0)
-            
-        except (ValueError, TypeError):
-            return False
-    
-    def _is_bengaluru_journey(self, origin: Dict[str, Any], destination: Dict[str, Any]) -> bool:
-        """Check if journey is within Bengaluru metropolitan area."""
-        try:
-            # Bengaluru bounding box
-            bengaluru_bounds = {
-                "north": 13.5,
-                "south": 12.5,
-                "east": 78.0,
-                "west": 77.0
-            }
-            
-            origin_in_bounds = (
-                bengaluru_bounds["south"] <= origin["lat"] <= bengaluru_bounds["north"] and
-                bengaluru_bounds["west"] <= origin["lng"] <= bengaluru_bounds["east"]
-            )
-            
-            dest_in_bounds = (
-                bengaluru_bounds["south"] <= destination["lat"] <= bengaluru_bounds["north"] and
-                bengaluru_bounds["west"] <= destination["lng"] <= bengaluru_bounds["east"]
-            )
+    def _count_choke_point_traffic(self, journeys: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Count journeys passing each choke point in one pass.
+
+        The per-pair distance/bbox helpers are inlined: each journey's
+        floats and route bbox are pulled out once, then every choke
+        point is checked against them. A journey passes a point when
+        either endpoint is within 5 km (compared in squared degrees,
+        no sqrt) or the route bbox contains it.
+        """
+        points = self._cp_points
+        counts = dict.fromkeys(self.choke_points, 0)
+        
+        for journey in journeys:
+            try:
+                origin = journey["origin"]
+                destination = journey["destination"]
+                o_lat, o_lng = float(origin["lat"]), float(origin["lng"])
+                d_lat, d_lng = float(destination["lat"]), float(destination["lng"])
+            except (KeyError, TypeError, ValueError):
+                continue
             
-            return origin_in_bounds or dest_in_bounds
+            min_lat, max_lat = (o_lat, d_lat) if o_lat <= d_lat else (d_lat, o_lat)
+            min_lng, max_lng = (o_lng, d_lng) if o_lng <= d_lng else (d_lng, o_lng)
             
-        except Exception:
-            return False
+            for cp_id, cp_lat, cp_lng in points:
+                if ((min_lat <= cp_lat <= max_lat and min_lng <= cp_lng <= max_lng)
+                        or (o_lat - cp_lat) ** 2 + (o_lng - cp_lng) ** 2 < _NEAR_SQ
+                        or (d_lat - cp_lat) ** 2 + (d_lng - cp_lng) ** 2 < _NEAR_SQ):
+                    counts[cp_id] += 1
+        
+        return counts
     
-    async def _analyze_choke_point_load(self, choke_point_id: str, journeys: List[Dict[str, Any]]) -> Dict[str, Any]:
-        """Analyze traffic load at a specific choke point."""
+    def _score_choke_point_load(self, choke_point_id: str, vehicles_through_point: int) -> Dict[str, Any]:
+        """Score congestion at a choke point from its vehicle count."""
         try:
             choke_point = self.choke_points[choke_point_id]
-            vehicles_through_point = 0
-            
-            # Count vehicles that would pass through this choke point
-            for journey in journeys:
-                if await self._journey_passes_through_choke_point(journey, choke_point):
-                    vehicles_through_point += 1
             
             # Calculate congestion score
             capacity = choke_point["capacity"]
@@ -393,70 +413,11 @@ class ADKSimulationAgent(PravaahAgent):
                 "error": str(e)
             }
     
-    async def _journey_passes_through_choke_point(self, journey: Dict[str, Any], choke_point: Dict[str, Any]) -> bool:
-        """Determine if a journey passes through a specific choke point."""
-        try:
-            origin = journey["origin"]
-            destination = journey["destination"]
-            cp_coords = choke_point["coordinates"]
-            
-            # Check if journey crosses the choke point area (simplified)
-            origin_distance = self._calculate_distance(origin, cp_coords)
-            dest_distance = self._calculate_distance(destination, cp_coords)
-            
-            # If either origin or destination is near the choke point, or
-            # if the journey crosses the general area, consider it passes through
-            return (origin_distance < 5.0 or dest_distance < 5.0 or 
-                    self._route_crosses_area(origin, destination, cp_coords))
-            
-        except Exception as e:
-            logger.error(f"Error checking journey route: {e}")
-            return False
-    
-    def _calculate_distance(self, point1: Dict[str, Any], point2: Dict[str, Any]) -> float:
-        """Calculate distance between two points (simplified)."""
-        try:
-            import math
-            
-            lat1, lng1 = point1["lat"], point1["lng"]
-            lat2, lng2 = point2["lat"], point2["lng"]
-            
-            # Simplified distance calculation
-            return math.sqrt((lat2 - lat1)**2 + (lng2 - lng1)**2) * 111  # Rough km conversion
-            
-        except Exception:
-            return float('inf')
-    
-    def _route_crosses_area(self, origin: Dict[str, Any], destination: Dict[str, Any], choke_point: Dict[str, Any]) -> bool:
-        """Check if route between origin and destination crosses choke point area."""
-        try:
-            # Simplified check: if choke point is roughly between origin and destination
-            cp_lat, cp_lng = choke_point["lat"], choke_point["lng"]
-            
-            min_lat = min(origin["lat"], destination["lat"])
-            max_lat = max(origin["lat"], destination["lat"])
-            min_lng = min(origin["lng"], destination["lng"])
-            max_lng = max(origin["lng"], destination["lng"])
-            
-            return (min_lat <= cp_lat <= max_lat) and (min_lng <= cp_lng <= max_lng)
-            
-        except Exception:
-            return False
-    
     def _get_congestion_status(self, congestion_score: float) -> str:
         """Get congestion status based on score."""
-        if congestion_score >= 80:
-            return "critical"
-        elif congestion_score >= 60:
-            return "high"
-        elif congestion_score >= 40:
-            return "medium"
-        elif congestion_score >= 20:
-            return "low"
-        else:
-            return "minimal"
+        return _STATUS_LABELS[bisect.bisect_right(_STATUS_BINS, congestion_score)]
     
-    async def _generate_recommendations(self, choke_point_analysis: Dict[str, Any], avg_score: float) -> List[str]:
+    def _generate_recommendations(self, choke_point_analysis: Dict[str, Any], avg_score: float) -> List[str]:
         """Generate traffic management recommendations."""
         recommendations = []
         
@@ -489,7 +450,7 @@ class ADKSimulationAgent(PravaahAgent):
         
         return recommendations
     
-    async def _calculate_prediction_confidence(self, journeys: List[Dict[str, Any]], analysis: Dict[str, Any]) -> float:
+    def _calculate_prediction_confidence(self, journeys: List[Dict[str, Any]], analysis: Dict[str, Any]) -> float:
         """Calculate confidence score for the prediction."""
         try:
             # Base confidence on data quality and quantity
@@ -528,8 +489,7 @@ class ADKSimulationAgent(PravaahAgent):
             
             while self.status == "active":
                 try:
-                    # Run periodic predictions
-                    await asyncio.sleep(120)  # Run every 2 minutes
+                    await asyncio.sleep(120)
                     
                 except Exception as e:
                     logger.error(f"Error in prediction loop: {e}")
@@ -6,23 +6,35 @@ and sending alerts via Firebase Cloud Messaging.
 """
 
 import os
-import logging
 import uuid
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from google.cloud import firestore
+from google.api_core import retry
+from google.api_core.exceptions import Aborted, DeadlineExceeded
 import firebase_admin
 from firebase_admin import credentials, messaging
 
+from ._base import _BaseAgent
 
-class CommunicationsAgent:
+
+class CommunicationsAgent(_BaseAgent):
     """
     Communications Agent responsible for executing commands and sending notifications.
     
     This agent implements the decisions made by the Orchestrator by updating
     database records and sending real-time alerts to vehicles and users.
     """
-    
+
+    # Firestore allows 500 mutations per WriteBatch; leave headroom
+    MAX_BATCH_WRITES = 450
+    BATCH_COMMIT_WORKERS = 40
+
+    # FCM caps a MulticastMessage at 500 tokens
+    FCM_MULTICAST_LIMIT = 500
+    FCM_SEND_WORKERS = 10
+
     def __init__(self, project_id: str = "stable-sign-454210-i0"):
         """
         Initialize the Communications Agent with Firebase Admin SDK.
@@ -30,10 +42,8 @@ class CommunicationsAgent:
         Args:
             project_id: Google Cloud Project ID
         """
-        self.project_id = project_id
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        
+        super().__init__(project_id)
+
         # Initialize Firebase Admin SDK (same pattern as ObserverAgent)
         try:
             # Check if Firebase app is already initialized
@@ -53,10 +63,7 @@ class CommunicationsAgent:
             else:
                 self.logger.error(f"Service account key not found at: {service_account_path}")
                 raise FileNotFoundError(f"Service account key not found: {service_account_path}")
-        
-        # Initialize Firestore client
-        self.db = firestore.Client(project=project_id)
-        
+
         # Communications metrics
         self.metrics = {
             'total_executions': 0,
@@ -83,12 +90,23 @@ class CommunicationsAgent:
             Dict containing execution results
         """
         execution_start = datetime.now()
-        execution_id = f"exec_{execution_start.strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}"
-        correlation_id = payload.get('correlation_id', str(uuid.uuid4()))
+        # uuid4().hex is cheaper than strftime-based IDs and collision-safe
+        # at sub-second rates
+        execution_id = f"exec_{uuid.uuid4().hex[:12]}"
+        correlation_id = payload.get('correlation_id', uuid.uuid4().hex)
         
         self.logger.info(f"[{correlation_id}] Starting reroute execution: {execution_id}")
         self.metrics['total_executions'] += 1
-        
+
+        # Orchestration decisions carrying a fleet of routing commands are
+        # applied via batched writes instead of the per-journey path below
+        fleet_commands = (
+            payload.get('decisions', {}).get('fleet_routing_commands')
+            or payload.get('fleet_routing_commands')
+        )
+        if fleet_commands:
+            return self._execute_fleet_reroute(fleet_commands, execution_id, correlation_id)
+
         # Extract payload data
         journey_id = payload.get('journeyId')
         new_route_data = payload.get('new_route_data')
@@ -114,14 +132,16 @@ class CommunicationsAgent:
                 self.metrics['failed_updates'] += 1
                 return self._create_error_result(execution_id, correlation_id, error_msg)
             
-            # Update journey with new route and status
+            # Update journey with new route and status (single timestamp
+            # capture - datetime.now() is on the per-execution hot path)
+            now = datetime.now()
             update_data = {
                 'route_data': new_route_data,
                 'status': 'REROUTED',
                 'reroute_reason': reason_for_change,
-                'rerouted_at': datetime.now(),
+                'rerouted_at': now,
                 'reroute_execution_id': execution_id,
-                'updated_at': datetime.now()
+                'updated_at': now
             }
             
             journey_ref.update(update_data)
@@ -178,6 +198,99 @@ class CommunicationsAgent:
             self.metrics['failed_updates'] += 1
             return self._create_error_result(execution_id, correlation_id, str(e))
     
+    def _execute_fleet_reroute(self,
+                               fleet_commands: List[Dict[str, Any]],
+                               execution_id: str,
+                               correlation_id: str) -> Dict[str, Any]:
+        """
+        Apply a fleet of routing commands using batched Firestore writes.
+
+        Instead of one round-trip per route document, commands are chunked
+        into WriteBatch objects (<=450 mutations each) and the batch commits
+        are dispatched in parallel, so bulk reroutes cost a handful of RPCs
+        rather than one per vehicle.
+
+        WriteBatch is deliberately non-transactional: the merge-sets are
+        idempotent, and a read-write transaction would pay an extra
+        beginTransaction round-trip per commit for no added safety here.
+        Escalate to self.db.transaction() only for read-then-write
+        reconciliation, and batch the reads with get_all inside it.
+
+        Args:
+            fleet_commands: List of routing commands, each containing
+                a vehicle_id and its new route data
+            execution_id: Unique execution identifier
+            correlation_id: Correlation ID for tracing
+
+        Returns:
+            Dict containing execution results for the bulk update
+        """
+        execution_start = datetime.now()
+        self.logger.info(
+            f"[{correlation_id}] Executing fleet reroute for "
+            f"{len(fleet_commands)} vehicles: {execution_id}"
+        )
+
+        # Retry transient batch-commit failures (contention / deadline)
+        commit_retry = retry.Retry(
+            predicate=retry.if_exception_type(Aborted, DeadlineExceeded)
+        )
+
+        def _commit_chunk(chunk: List[Dict[str, Any]]) -> int:
+            batch = self.db.batch()
+            for cmd in chunk:
+                doc_ref = self.db.collection('routes').document(cmd['vehicle_id'])
+                batch.set(doc_ref, cmd.get('route', {}), merge=True)
+            commit_retry(batch.commit)()
+            return len(chunk)
+
+        try:
+            # Chunk commands into batches within the Firestore mutation limit
+            commands_iter = iter(fleet_commands)
+            chunks = []
+            while True:
+                chunk = list(islice(commands_iter, self.MAX_BATCH_WRITES))
+                if not chunk:
+                    break
+                chunks.append(chunk)
+
+            # Commit batches in parallel - workload is network-bound
+            updated_count = 0
+            with ThreadPoolExecutor(max_workers=self.BATCH_COMMIT_WORKERS) as executor:
+                for committed in executor.map(_commit_chunk, chunks):
+                    updated_count += committed
+
+            self.metrics['successful_updates'] += updated_count
+            execution_duration = (datetime.now() - execution_start).total_seconds()
+
+            self.logger.info(
+                f"[{correlation_id}] Fleet reroute completed: {updated_count} "
+                f"routes updated in {len(chunks)} batches ({execution_duration:.3f}s)"
+            )
+
+            return {
+                "timestamp": execution_start.isoformat(),
+                "execution_id": execution_id,
+                "correlation_id": correlation_id,
+                "status": "success",
+                "results": {
+                    "database_update": {
+                        "status": "success",
+                        "routes_updated": updated_count,
+                        "batches_committed": len(chunks)
+                    }
+                },
+                "performance": {
+                    "execution_time_seconds": round(execution_duration, 3),
+                    "database_operation_success": True
+                }
+            }
+
+        except Exception as e:
+            self.logger.error(f"[{correlation_id}] Failed to execute fleet reroute: {str(e)}")
+            self.metrics['failed_updates'] += 1
+            return self._create_error_result(execution_id, correlation_id, str(e))
+
     def _send_fcm_alert(self, notification_payload: Dict[str, Any]) -> Dict[str, Any]:
         """
         Send Firebase Cloud Messaging alert for journey reroute.
@@ -196,42 +309,34 @@ class CommunicationsAgent:
         journey_id = notification_payload.get('journey_id')
         reason = notification_payload.get('reason')
         correlation_id = notification_payload.get('correlation_id')
-        
+        recipient_tokens = notification_payload.get('recipient_tokens') or []
+
         try:
-            # For hackathon: Log FCM alert to console as requested
-            self.logger.info(f"FCM Alert Sent: Rerouting Journey [{journey_id}] due to [{reason}]")
-            
-            # In production, this would send actual FCM notifications
-            # Example production code (commented for hackathon):
-            # message = messaging.Message(
-            #     notification=messaging.Notification(
-            #         title="Route Update - Project Pravaah",
-            #         body=f"Your journey has been rerouted due to {reason}"
-            #     ),
-            #     data={
-            #         'journey_id': journey_id,
-            #         'reason': reason,
-            #         'action': 'route_update'
-            #     },
-            #     topic='journey_updates'  # or specific FCM tokens
-            # )
-            # response = messaging.send(message)
-            
-            # Simulate successful notification for hackathon
+            if recipient_tokens:
+                # Real delivery: multiplex over the shared firebase_admin app
+                # (one HTTP/2 channel, concurrent streams per multicast)
+                delivery = self._send_fcm_multicast(
+                    recipient_tokens, journey_id, reason, correlation_id
+                )
+            else:
+                # For hackathon: Log FCM alert to console as requested
+                self.logger.info(f"FCM Alert Sent: Rerouting Journey [{journey_id}] due to [{reason}]")
+                delivery = {
+                    "method": "console_log_simulation",  # For hackathon
+                    "successful": True,
+                    "message": f"FCM Alert Sent: Rerouting Journey [{journey_id}] due to [{reason}]"
+                }
+
             self.metrics['notifications_sent'] += 1
             
             fcm_result = {
                 "timestamp": datetime.now().isoformat(),
-                "message_id": f"msg_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid.uuid4())[:8]}",
+                "message_id": f"msg_{uuid.uuid4().hex[:12]}",
                 "status": "success",
                 "journey_id": journey_id,
                 "correlation_id": correlation_id,
                 "notification_type": "reroute_alert",
-                "delivery_status": {
-                    "method": "console_log_simulation",  # For hackathon
-                    "successful": True,
-                    "message": f"FCM Alert Sent: Rerouting Journey [{journey_id}] due to [{reason}]"
-                },
+                "delivery_status": delivery,
                 "message_metadata": {
                     "priority": "high",  # Reroute notifications are high priority
                     "notification_title": "Route Update - Project Pravaah",
@@ -259,6 +364,76 @@ class CommunicationsAgent:
                 }
             }
     
+    def _send_fcm_multicast(self,
+                            recipient_tokens: List[str],
+                            journey_id: str,
+                            reason: str,
+                            correlation_id: str) -> Dict[str, Any]:
+        """
+        Deliver a reroute alert to device tokens via multiplexed FCM sends.
+
+        Tokens are chunked into MulticastMessages (FCM caps each at 500
+        tokens) and dispatched through `messaging.send_each_for_multicast`,
+        which fans the sends out over concurrent HTTP/2 streams on the
+        shared firebase_admin app - avoiding a round-trip per recipient.
+
+        Args:
+            recipient_tokens: FCM registration tokens to notify
+            journey_id: Journey identifier for the notification payload
+            reason: Reason for the reroute
+            correlation_id: Correlation ID for tracing
+
+        Returns:
+            Dict containing delivery results across all chunks
+        """
+        def _send_chunk(tokens: List[str]) -> Any:
+            multicast = messaging.MulticastMessage(
+                tokens=tokens,
+                notification=messaging.Notification(
+                    title="Route Update - Project Pravaah",
+                    body=f"Your journey has been rerouted due to {reason}"
+                ),
+                data={
+                    'journey_id': str(journey_id),
+                    'reason': str(reason),
+                    'action': 'route_update'
+                },
+                android=messaging.AndroidConfig(priority='high')
+            )
+            return messaging.send_each_for_multicast(multicast)
+
+        chunks = [
+            recipient_tokens[i:i + self.FCM_MULTICAST_LIMIT]
+            for i in range(0, len(recipient_tokens), self.FCM_MULTICAST_LIMIT)
+        ]
+
+        success_count = 0
+        failure_count = 0
+        with ThreadPoolExecutor(max_workers=self.FCM_SEND_WORKERS) as executor:
+            for response in executor.map(_send_chunk, chunks):
+                success_count += response.success_count
+                failure_count += response.failure_count
+
+        if failure_count:
+            self.logger.warning(
+                f"[{correlation_id}] FCM delivery: {success_count} sent, "
+                f"{failure_count} failed for journey {journey_id}"
+            )
+            self.metrics['notification_failures'] += failure_count
+        else:
+            self.logger.info(
+                f"[{correlation_id}] FCM delivery: {success_count} sent "
+                f"for journey {journey_id}"
+            )
+
+        return {
+            "method": "fcm_multicast",
+            "successful": failure_count == 0,
+            "recipients": len(recipient_tokens),
+            "success_count": success_count,
+            "failure_count": failure_count
+        }
+
     def _create_error_result(self, execution_id: str, correlation_id: str, error_message: str) -> Dict[str, Any]:
         """
         Create standardized error result for failed operations.
@@ -50,7 +50,7 @@ async def startup_event():
     try:
         logger.info("Initializing ADK Communications Agent...")
         communications_agent = ADKCommunicationsAgent()
-        await communications_agent.on_start()
+        await communications_agent.start()
         logger.info("Communications Agent initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Communications Agent: {e}")
@@ -62,7 +62,7 @@ async def shutdown_event():
     global communications_agent
     if communications_agent:
         try:
-            await communications_agent.on_stop()
+            await communications_agent.stop()
             logger.info("Communications Agent stopped successfully")
         except Exception as e:
             logger.error(f"Error stopping Communications Agent: {e}")
@@ -150,7 +150,7 @@ class ObserverAgent:
         Args:
             message: Pub/Sub message containing vehicle telemetry data
         """
-        correlation_id = str(uuid.uuid4())
+        correlation_id = uuid.uuid4().hex
         start_time = datetime.now()
         
         try:
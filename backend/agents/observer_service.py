@@ -50,7 +50,7 @@ async def startup_event():
     try:
         logger.info("Initializing ADK Observer Agent...")
         observer_agent = ADKObserverAgent()
-        await observer_agent.on_start()
+        await observer_agent.start()
         logger.info("Observer Agent initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Observer Agent: {e}")
@@ -62,7 +62,7 @@ async def shutdown_event():
     global observer_agent
     if observer_agent:
         try:
-            await observer_agent.on_stop()
+            await observer_agent.stop()
             logger.info("Observer Agent stopped successfully")
         except Exception as e:
             logger.error(f"Error stopping Observer Agent: {e}")
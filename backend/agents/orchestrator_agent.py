@@ -8,9 +8,9 @@ import logging
 import asyncio
 import json
 import os
+import uuid
 from typing import Dict, Any, List, Optional
 from datetime import datetime, timedelta
-from google.cloud import firestore
 import vertexai
 from vertexai.generative_models import GenerativeModel
 
@@ -292,7 +292,8 @@ Respond with ONLY a valid JSON object in this exact format:
             - Intervention details and affected vehicles
         """
         cycle_start_time = datetime.now()
-        cycle_id = f"cycle_{cycle_start_time.strftime('%Y%m%d_%H%M%S')}"
+        # uuid4().hex avoids strftime formatting cost and sub-second collisions
+        cycle_id = f"cycle_{uuid.uuid4().hex[:12]}"
         
         self.logger.info(f"Starting orchestration cycle [{cycle_id}]")
         
@@ -58,7 +58,7 @@ async def startup_event():
     try:
         logger.info("Initializing ADK Orchestrator Agent...")
         orchestrator_agent = ADKOrchestratorAgent()
-        await orchestrator_agent.on_start()
+        await orchestrator_agent.start()
         logger.info("Orchestrator Agent initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Orchestrator Agent: {e}")
@@ -70,7 +70,7 @@ async def shutdown_event():
     global orchestrator_agent
     if orchestrator_agent:
         try:
-            await orchestrator_agent.on_stop()
+            await orchestrator_agent.stop()
             logger.info("Orchestrator Agent stopped successfully")
         except Exception as e:
             logger.error(f"Error stopping Orchestrator Agent: {e}")
@@ -5,13 +5,13 @@ and traffic congestion patterns in the urban mobility network.
 """
 
 import math
-import logging
 from typing import Dict, Any, List, Tuple
 from datetime import datetime, timedelta
-from google.cloud import firestore
 
+from ._base import _BaseAgent
 
-class SimulationAgent:
+
+class SimulationAgent(_BaseAgent):
     """
     Simulation Agent responsible for predictive traffic modeling and gridlock forecasting.
     
@@ -48,11 +48,8 @@ class SimulationAgent:
         Args:
             project_id: Google Cloud Project ID
         """
-        self.project_id = project_id
-        self.db = firestore.Client(project=project_id)
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.INFO)
-        
+        super().__init__(project_id)
+
         self.logger.info(f"SimulationAgent initialized for project: {project_id}")
         self.logger.info(f"Monitoring {len(self.CHOKE_POINTS)} critical choke points in Bengaluru")
     
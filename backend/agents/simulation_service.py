@@ -50,7 +50,7 @@ async def startup_event():
     try:
         logger.info("Initializing ADK Simulation Agent...")
         simulation_agent = ADKSimulationAgent()
-        await simulation_agent.on_start()
+        await simulation_agent.start()
         logger.info("Simulation Agent initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize Simulation Agent: {e}")
@@ -62,7 +62,7 @@ async def shutdown_event():
     global simulation_agent
     if simulation_agent:
         try:
-            await simulation_agent.on_stop()
+            await simulation_agent.stop()
             logger.info("Simulation Agent stopped successfully")
         except Exception as e:
             logger.error(f"Error stopping Simulation Agent: {e}")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Project Pravaah - ADK Pub/Sub Bootstrap Script
+==============================================
+One-shot provisioning of the A2A messaging topic and per-agent
+subscriptions. Run once per environment (ops task); agents assume the
+resources exist at boot and skip the admin RPCs, which keeps cold
+starts fast. For ad-hoc local runs, agents can instead be started with
+ADK_ENSURE_RESOURCES=1 to create resources on the fly.
+"""
+
+import sys
+
+from google.api_core.exceptions import AlreadyExists
+from google.cloud import pubsub_v1
+
+from adk_base import ADKConfig
+
+# Agent IDs that need an A2A subscription
+AGENT_IDS = [
+    "observer-agent",
+    "simulation-agent",
+    "orchestrator-agent",
+    "communications-agent",
+]
+
+
+def bootstrap(config_path: str = "adk_config.yaml") -> None:
+    """Create the A2A topic and one subscription per agent."""
+    config = ADKConfig(config_path)
+    publisher = pubsub_v1.PublisherClient()
+    subscriber = pubsub_v1.SubscriberClient()
+
+    topic_path = publisher.topic_path(config.project_id, config.topic)
+
+    print(f"🚀 Bootstrapping ADK Pub/Sub resources in {config.project_id}...")
+
+    try:
+        publisher.create_topic(request={"name": topic_path})
+        print(f"✅ Created topic: {topic_path}")
+    except AlreadyExists:
+        print(f"📁 Topic already exists: {topic_path}")
+
+    for agent_id in AGENT_IDS:
+        subscription_path = subscriber.subscription_path(
+            config.project_id, f"{config.subscription_prefix}{agent_id}"
+        )
+        try:
+            subscriber.create_subscription(
+                request={
+                    "name": subscription_path,
+                    "topic": topic_path,
+                    "ack_deadline_seconds": config.ack_deadline,
+                    "filter": (
+                        f'attributes.receiver="{agent_id}" '
+                        f'OR attributes.receiver="all"'
+                    ),
+                }
+            )
+            print(f"✅ Created subscription: {subscription_path}")
+        except AlreadyExists:
+            print(f"📁 Subscription already exists: {subscription_path}")
+
+    print("🎉 ADK Pub/Sub bootstrap finished!")
+
+
+if __name__ == "__main__":
+    bootstrap(sys.argv[1] if len(sys.argv) > 1 else "adk_config.yaml")
@@ -59,7 +59,7 @@ class DemoOrchestrationRequest(BaseModel):
     emergency_alerts: List[Dict[str, Any]] = Field(default_factory=list, description="Active emergency alerts")
     demo_scenario: str = Field(default="normal", description="Demo scenario type")
     timestamp: str = Field(default_factory=lambda: datetime.now(timezone.utc).isoformat(), description="Request timestamp")
-    correlation_id: str = Field(default_factory=lambda: str(uuid.uuid4()), description="Request correlation ID")
+    correlation_id: str = Field(default_factory=lambda: uuid.uuid4().hex, description="Request correlation ID")
 
 class DemoOrchestrationResponse(BaseModel):
     """Response model for demo orchestration endpoint."""